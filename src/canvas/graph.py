@@ -1,4 +1,12 @@
-from util import Queue
+from array import array
+from collections import namedtuple
+
+from util import IntQueue
+from weighted import WeightedGraph
+
+# order: labels in visit order; distances: label -> edges from the start (tree depth for DFS);
+# parents: label -> label it was reached from (None for the start)
+Traversal = namedtuple("Traversal", "order distances parents")
 
 
 class Vertex:
@@ -26,6 +34,8 @@ class Graph:
     def __init__(self):
         self.vertices = {}
         self.count = 0
+        self.version = 0  # bumped on every change so the weighted() snapshot goes stale
+        self._weighted = None
 
     def __contains__(self, vert):
         return vert in self.vertices
@@ -35,6 +45,7 @@ class Graph:
 
     def add_vertex(self, value):
         self.count += 1
+        self.version += 1
         new_vert = Vertex(value)
         self.vertices[value] = new_vert
         return new_vert
@@ -44,27 +55,106 @@ class Graph:
             self.add_vertex(v1)
         if v2 not in self.vertices:
             self.add_vertex(v2)
-        self.vertices[v1].add_connection(self.vertices[v2], weight)
+        self.vertices[v1].add_connections(self.vertices[v2], weight)
+        self.version += 1
 
     def get_vertices(self):
         return self.vertices.keys()
 
+    def weighted(self):
+        """Return a WeightedGraph snapshot of this graph, rebuilt only after add_vertex/add_edge change it."""
+        if self._weighted is None or self._weighted[0] != self.version:
+            self._weighted = (self.version, WeightedGraph.from_vertices(self.vertices))
+        return self._weighted[1]
+
+    def dijkstra(self, start, target=None, queue="heap"):
+        """Return a ShortestPaths mapping of label -> weighted distance from start (see weighted.py)."""
+        return self.weighted().dijkstra(start, target, queue)
+
+    def a_star(self, start, goal, heuristic=None):
+        """Return ShortestPaths from start that is exact for goal, guided by heuristic(label, goal)."""
+        return self.weighted().a_star(start, goal, heuristic)
+
     def breadth_first_search(self, starting_vert):
-        to_visit = Queue()
-        visited = set()
-        to_visit.enqueue(starting_vert)
-        visited.add(starting_vert)
+        """
+        Return a Traversal of every vertex reachable from starting_vert (a label or a Vertex), breadth first.
+
+        Like the depth-first search, it runs on integer vertex ids over the weighted() CSR snapshot.
+        """
+        snapshot = self.weighted()
+        offsets, targets = snapshot.offsets, snapshot.targets
+        start = self._index_of(snapshot, starting_vert)
+        distances = array("q", [-1]) * len(snapshot.labels)
+        parents = array("q", [-1]) * len(snapshot.labels)
+        # each vertex is queued at most once, so a ring buffer sized to the graph suffices
+        to_visit = IntQueue(len(snapshot.labels))
+        to_visit.enqueue(start)
+        distances[start] = 0
+        order = []
         while to_visit.size() > 0:
             current_vert = to_visit.dequeue()
-            for next_vert in current_vert.get_connections():
-                if next_vert not in visited:
-                    visited.add(next_vert)
+            order.append(current_vert)
+            for next_vert in targets[offsets[current_vert]:offsets[current_vert + 1]]:
+                if distances[next_vert] == -1:
+                    distances[next_vert] = distances[current_vert] + 1
+                    parents[next_vert] = current_vert
                     to_visit.enqueue(next_vert)
+        return self._traversal(snapshot, order, distances, parents)
 
     def depth_first_search(self, vertex, visited=None):
-        if not visited:
-            visited = set()
-        visited.add(vertex)
-        for next_vert in vertex.get_connections():
-            if next_vert not in visited:
-                self.depth_first_search(next_vert, visited)
+        """
+        Return a Traversal of every vertex reachable from vertex (a label or a Vertex), in depth-first pre-order.
+
+        Vertices in visited (labels or Vertex objects) are treated as already seen.
+        The recursion runs on an explicit stack of (vertex, edge cursor) frames, so
+        long paths don't hit the recursion limit.
+        """
+        snapshot = self.weighted()
+        offsets, targets = snapshot.offsets, snapshot.targets
+        start = self._index_of(snapshot, vertex)
+        distances = array("q", [-1]) * len(snapshot.labels)
+        parents = array("q", [-1]) * len(snapshot.labels)
+        seen = bytearray(len(snapshot.labels))
+        for vert in visited or ():
+            seen[self._index_of(snapshot, vert)] = 1
+        seen[start] = 1
+        distances[start] = 0
+        order = [start]
+        verts = array("q", [start])
+        cursors = array("q", [offsets[start]])  # the next edge of verts[i] to try
+        while verts:
+            current_vert = verts[-1]
+            cursor, end = cursors[-1], offsets[current_vert + 1]
+            while cursor < end and seen[targets[cursor]]:
+                cursor += 1
+            if cursor == end:
+                verts.pop()  # every neighbor is done -- "return" to the vertex below
+                cursors.pop()
+                continue
+            cursors[-1] = cursor + 1
+            next_vert = targets[cursor]
+            seen[next_vert] = 1
+            distances[next_vert] = len(verts)
+            parents[next_vert] = current_vert
+            order.append(next_vert)
+            verts.append(next_vert)  # "recurse" into next_vert
+            cursors.append(offsets[next_vert])
+        return self._traversal(snapshot, order, distances, parents)
+
+    @staticmethod
+    def _index_of(snapshot, vert):
+        label = vert.value if isinstance(vert, Vertex) else vert
+        if label in snapshot.index:
+            return snapshot.index[label]
+        else:
+            raise KeyError(f"{label} is not a vertex in this graph!")
+
+    @staticmethod
+    def _traversal(snapshot, order, distances, parents):
+        """Translate integer-id traversal results back to labels."""
+        labels = snapshot.labels
+        return Traversal(
+            [labels[vert] for vert in order],
+            {labels[vert]: distances[vert] for vert in order},
+            {labels[vert]: labels[parents[vert]] if parents[vert] != -1 else None for vert in order},
+        )
@@ -0,0 +1,64 @@
+import unittest
+
+from graph import Graph, Traversal
+
+
+class GraphTest(unittest.TestCase):
+    def setUp(self):
+        # the weighted example graph from lecture/graph_canvas.py
+        self.graph = Graph()
+        for v1, v2, weight in [(0, 1, 3), (0, 7, 2), (1, 3, 4), (2, 2, 1), (3, 6, 5),
+                               (4, 0, 2), (5, 2, 3), (5, 3, 1), (6, 2, 3), (7, 1, 4)]:
+            self.graph.add_edge(v1, v2, weight)
+
+    def test_add_edge(self):
+        vertices = self.graph.vertices
+        self.assertEqual(len(vertices), 8)
+        self.assertIn(6, self.graph)
+        self.assertEqual({vert.value for vert in vertices[0].get_connections()}, {1, 7})
+        self.assertEqual(vertices[3].get_weight(vertices[6]), 5)
+        self.graph.add_edge(8, 9, 7)  # both endpoints are created on the way
+        self.assertEqual(vertices[8].get_weight(vertices[9]), 7)
+
+    def test_breadth_first_search(self):
+        self.assertEqual(self.graph.breadth_first_search(0), Traversal(
+            [0, 1, 7, 3, 6, 2],
+            {0: 0, 1: 1, 7: 1, 3: 2, 6: 3, 2: 4},
+            {0: None, 1: 0, 7: 0, 3: 1, 6: 3, 2: 6},
+        ))
+        self.assertEqual(self.graph.breadth_first_search(2), Traversal([2], {2: 0}, {2: None}))
+
+    def test_depth_first_search(self):
+        self.assertEqual(self.graph.depth_first_search(0), Traversal(
+            [0, 1, 3, 6, 2, 7],
+            {0: 0, 1: 1, 3: 2, 6: 3, 2: 4, 7: 1},
+            {0: None, 1: 0, 3: 1, 6: 3, 2: 6, 7: 0},
+        ))
+        self.assertEqual(self.graph.depth_first_search(0, visited={1}).order, [0, 7])
+        self.assertEqual(self.graph.depth_first_search(0, visited=[self.graph.vertices[3]]).order, [0, 1, 7])
+
+    def test_vertex_or_label(self):
+        vertex = self.graph.vertices[5]
+        self.assertEqual(self.graph.breadth_first_search(vertex), self.graph.breadth_first_search(5))
+        self.assertEqual(self.graph.depth_first_search(vertex), self.graph.depth_first_search(5))
+        with self.assertRaises(KeyError):
+            self.graph.breadth_first_search(42)
+
+    def test_traversal_follows_changes(self):
+        self.assertNotIn(5, self.graph.breadth_first_search(0).order)
+        self.graph.add_edge(6, 5)
+        self.assertEqual(self.graph.breadth_first_search(0).distances[5], 4)
+
+    def test_long_chain(self):
+        graph = Graph()
+        length = 10 ** 5  # far deeper than the recursion limit
+        for vert in range(1, length):
+            graph.add_edge(vert - 1, vert)
+        traversal = graph.depth_first_search(0)
+        self.assertEqual(traversal.order, list(range(length)))
+        self.assertEqual(traversal.distances[length - 1], length - 1)
+        self.assertEqual(graph.breadth_first_search(0).parents[length - 1], length - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
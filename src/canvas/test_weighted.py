@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from graph import Graph
+from weighted import INF, manhattan
+
+
+def random_graph(rng, num_vertices, num_edges, max_weight=9):
+    graph = Graph()
+    for vert in range(num_vertices):
+        graph.add_vertex(vert)
+    for _ in range(num_edges):
+        graph.add_edge(rng.randrange(num_vertices), rng.randrange(num_vertices), rng.randint(0, max_weight))
+    return graph
+
+
+def brute_force_distances(graph, source):
+    """Bellman-Ford: relax every edge until nothing changes."""
+    distances = {label: INF for label in graph.vertices}
+    distances[source] = 0
+    changed = True
+    while changed:
+        changed = False
+        for label, vertex in graph.vertices.items():
+            for next_vertex, weight in vertex.connections.items():
+                if distances[label] + weight < distances[next_vertex.value]:
+                    distances[next_vertex.value] = distances[label] + weight
+                    changed = True
+    return {label: distance for label, distance in distances.items() if distance != INF}
+
+
+class WeightedTest(unittest.TestCase):
+    def assertPathWeighs(self, graph, path, distance):
+        vertices = graph.vertices
+        self.assertEqual(sum(vertices[a].get_weight(vertices[b]) for a, b in zip(path, path[1:])), distance)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for trial in range(60):
+            graph = random_graph(rng, rng.randint(1, 30), rng.randint(0, 90))
+            source = rng.randrange(len(graph.vertices))
+            expected = brute_force_distances(graph, source)
+            for queue in ("heap", "bucket"):
+                paths = graph.dijkstra(source, queue=queue)
+                self.assertEqual(dict(paths), expected, (trial, queue))
+                for label, distance in expected.items():
+                    path = paths.path(label)
+                    self.assertEqual((path[0], path[-1]), (source, label))
+                    self.assertPathWeighs(graph, path, distance)
+            for goal in graph.vertices:
+                for search in (graph.a_star(source, goal), graph.dijkstra(source, target=goal, queue="bucket")):
+                    if goal in expected:
+                        self.assertEqual(search[goal], expected[goal])
+                        self.assertPathWeighs(graph, search.path(goal), expected[goal])
+                    else:
+                        self.assertNotIn(goal, search)
+                        self.assertIsNone(search.path(goal))
+
+    def test_a_star_manhattan(self):
+        rng = random.Random(1)
+        graph = Graph()
+        size = 20
+        for x in range(size):
+            for y in range(size):
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    if 0 <= x + dx < size and 0 <= y + dy < size:
+                        graph.add_edge((x, y), (x + dx, y + dy), rng.randint(1, 5))
+        heuristic = manhattan({label: label for label in graph.vertices})
+        expected = brute_force_distances(graph, (0, 0))
+        for goal in ((19, 19), (3, 15), (0, 0)):
+            search = graph.a_star((0, 0), goal, heuristic)
+            self.assertEqual(search[goal], expected[goal])
+            self.assertPathWeighs(graph, search.path(goal), expected[goal])
+        # the heuristic steers A* away from most of the grid
+        self.assertLess(len(graph.a_star((0, 0), (3, 3), heuristic)), len(graph.dijkstra((0, 0), target=(3, 3))))
+
+    def test_invalid_weights(self):
+        graph = Graph()
+        graph.add_edge(1, 2, 0.5)
+        self.assertEqual(graph.dijkstra(1)[2], 0.5)
+        with self.assertRaises(ValueError):
+            graph.dijkstra(1, queue="bucket")
+        with self.assertRaises(ValueError):
+            graph.dijkstra(1, queue="fibonacci")
+        with self.assertRaises(KeyError):
+            graph.a_star(1, 4)
+        with self.assertRaises(KeyError):
+            graph.dijkstra(1, target=4)
+        graph.add_edge(2, 3, -1)
+        with self.assertRaises(ValueError):
+            graph.dijkstra(1)
+
+    def test_snapshot_follows_changes(self):
+        graph = Graph()
+        graph.add_edge(1, 2, 5)
+        self.assertEqual(graph.dijkstra(1)[2], 5)
+        graph.add_edge(1, 3, 1)
+        graph.add_edge(3, 2, 1)
+        self.assertEqual(graph.dijkstra(1)[2], 2)
+        self.assertEqual(graph.dijkstra(1).path(2), [1, 3, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
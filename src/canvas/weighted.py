@@ -0,0 +1,236 @@
+"""
+Weighted shortest paths over a Graph whose Vertex.connections map neighbor -> weight.
+
+WeightedGraph.from_vertices() snapshots the graph as compressed sparse rows:
+vertex labels become indices 0..n-1, and the edges leaving index i are
+targets[offsets[i]:offsets[i + 1]] with their weights in the parallel
+weights array. The searches then run on plain integers and arrays instead
+of hashing Vertex objects.
+
+    dijkstra(source)                  binary-heap Dijkstra
+    dijkstra(source, queue="bucket")  Dial's bucket queue, for small non-negative integer weights
+    a_star(source, goal, heuristic)   A* guided by heuristic(label, goal), a lower bound on the distance
+
+Both return a ShortestPaths mapping of label -> distance whose paths are
+only rebuilt from parent pointers when asked for.
+"""
+import heapq
+import math
+from array import array
+from collections.abc import Mapping
+
+INF = math.inf
+NO_PARENT = -1
+
+
+class ShortestPaths(Mapping):
+    """
+    Read-only mapping of label -> shortest distance from one source, over the vertices a search settled.
+
+    Only distances and parent pointers (by vertex index) are kept; path(label)
+    walks the pointers back to the source when it is called.
+    """
+
+    def __init__(self, graph, source, distances, parents, settled, done):
+        self.graph = graph
+        self.source = source
+        self.distances = distances  # index -> distance (tentative unless done)
+        self.parents = parents  # index -> index it was reached from (NO_PARENT for the source)
+        self.settled = settled  # indices whose distance is final, in the order they were settled
+        self.done = done  # index -> 1 once settled
+
+    def __getitem__(self, label):
+        vert = self.graph.index.get(label)
+        if vert is None or not self.done[vert]:
+            raise KeyError(label)
+        return self.distances[vert]
+
+    def __iter__(self):
+        labels = self.graph.labels
+        return (labels[vert] for vert in self.settled)
+
+    def __len__(self):
+        return len(self.settled)
+
+    def __contains__(self, label):
+        vert = self.graph.index.get(label)
+        return vert is not None and self.done[vert] == 1
+
+    def path(self, label):
+        """Return the labels on a shortest path from the source to label, or None if label wasn't reached."""
+        if label not in self:
+            return None
+        labels, parents = self.graph.labels, self.parents
+        path = []
+        vert = self.graph.index[label]
+        while vert != NO_PARENT:
+            path.append(labels[vert])
+            vert = parents[vert]
+        path.reverse()
+        return path
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class WeightedGraph:
+    """Read-only CSR snapshot of a weighted graph; see the module docstring."""
+
+    def __init__(self, labels, offsets, targets, weights):
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("offsets must have exactly one more entry than labels")
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.min_weight = min(weights, default=0)
+        self.max_weight = max(weights, default=0)
+
+    @classmethod
+    def from_vertices(cls, vertices):
+        """Snapshot a label -> Vertex dict (Graph.vertices)."""
+        labels = list(vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        weights_list = [weight for vertex in vertices.values() for weight in vertex.connections.values()]
+        offsets = array("q", [0])
+        targets = array("i" if len(labels) < 2 ** 31 else "q")
+        # integer weights stay exact integers (and can use the bucket queue)
+        integral = all(isinstance(weight, int) for weight in weights_list)
+        weights = array("q" if integral else "d", weights_list)
+        for vertex in vertices.values():
+            targets.extend(index[next_vertex.value] for next_vertex in vertex.connections)
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, weights)
+
+    def dijkstra(self, source, target=None, queue="heap"):
+        """
+        Return ShortestPaths from source, stopping early once target (if given) is settled.
+
+        queue="bucket" uses Dial's algorithm: one bucket per distance, cycled with
+        max_weight + 1 slots, which beats a heap when the weights are small integers.
+        """
+        if self.min_weight < 0:
+            raise ValueError("Dijkstra needs non-negative edge weights")
+        start = self._index_of(source)
+        goal = self._index_of(target) if target is not None else NO_PARENT
+        if queue == "heap":
+            search = self._heap_search(start, goal, None)
+        elif queue == "bucket":
+            if self.weights.typecode != "q":
+                raise ValueError("the bucket queue needs integer edge weights")
+            search = self._bucket_search(start, goal)
+        else:
+            raise ValueError(f"unknown queue {queue!r}; expected 'heap' or 'bucket'")
+        return ShortestPaths(self, source, *search)
+
+    def a_star(self, source, goal, heuristic=None):
+        """
+        Return ShortestPaths from source that is exact for goal, searching toward goal first.
+
+        heuristic(label, goal) must never overestimate the distance from label to goal
+        and should be consistent, like manhattan and euclidean below. None means no
+        guidance (plain Dijkstra that stops at goal). It is called at most once per vertex.
+        """
+        if self.min_weight < 0:
+            raise ValueError("A* needs non-negative edge weights")
+        start = self._index_of(source)
+        end = self._index_of(goal)
+        if heuristic is None:
+            estimate = None
+        else:
+            labels = self.labels
+            estimate = lambda vert: heuristic(labels[vert], goal)
+        search = self._heap_search(start, end, estimate)
+        return ShortestPaths(self, source, *search)
+
+    def _index_of(self, label):
+        if label in self.index:
+            return self.index[label]
+        else:
+            raise KeyError(f"{label} is not a vertex in this graph!")
+
+    def _heap_search(self, start, goal, estimate):
+        """Dijkstra (estimate None) or A* with lazy deletion: stale heap entries are skipped when popped."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = [INF] * len(self.labels)
+        parents = array("q", [NO_PARENT]) * len(self.labels)
+        done = bytearray(len(self.labels))
+        settled = []
+        guesses = {}  # index -> heuristic value, so each vertex costs one heuristic call
+        distances[start] = 0
+        heap = [(0, start)]
+        push, pop = heapq.heappush, heapq.heappop
+        while heap:
+            _, vert = pop(heap)
+            if done[vert]:
+                continue
+            done[vert] = 1
+            settled.append(vert)
+            if vert == goal:
+                break
+            distance = distances[vert]
+            for edge in range(offsets[vert], offsets[vert + 1]):
+                next_vert = targets[edge]
+                next_distance = distance + weights[edge]
+                if next_distance < distances[next_vert]:
+                    distances[next_vert] = next_distance
+                    parents[next_vert] = vert
+                    if estimate is None:
+                        push(heap, (next_distance, next_vert))
+                    else:
+                        if next_vert not in guesses:
+                            guesses[next_vert] = estimate(next_vert)
+                        push(heap, (next_distance + guesses[next_vert], next_vert))
+        return distances, parents, settled, done
+
+    def _bucket_search(self, start, goal):
+        """Dial's algorithm: buckets[d % slots] holds the vertices queued at distance d."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = [INF] * len(self.labels)
+        parents = array("q", [NO_PARENT]) * len(self.labels)
+        done = bytearray(len(self.labels))
+        settled = []
+        # no queued distance is ever more than max_weight past the one being settled
+        slots = self.max_weight + 1
+        buckets = [[] for _ in range(slots)]
+        distances[start] = 0
+        buckets[0].append(start)
+        queued = 1
+        distance = 0
+        while queued:
+            bucket = buckets[distance % slots]
+            while bucket:  # zero-weight edges refill the bucket being drained
+                vert = bucket.pop()
+                queued -= 1
+                if done[vert] or distances[vert] != distance:
+                    continue  # settled already, or queued again later at a shorter distance
+                done[vert] = 1
+                settled.append(vert)
+                if vert == goal:
+                    return distances, parents, settled, done
+                for edge in range(offsets[vert], offsets[vert + 1]):
+                    next_vert = targets[edge]
+                    next_distance = distance + weights[edge]
+                    if next_distance < distances[next_vert]:
+                        distances[next_vert] = next_distance
+                        parents[next_vert] = vert
+                        buckets[next_distance % slots].append(next_vert)
+                        queued += 1
+            distance += 1
+        return distances, parents, settled, done
+
+
+def manhattan(positions):
+    """Heuristic for grid graphs: positions maps label -> (x, y), and every edge costs at least its grid length."""
+    def heuristic(label, goal):
+        (x1, y1), (x2, y2) = positions[label], positions[goal]
+        return abs(x1 - x2) + abs(y1 - y2)
+    return heuristic
+
+
+def euclidean(positions):
+    """Heuristic for geometric graphs: straight-line distance between positions[label] and positions[goal]."""
+    def heuristic(label, goal):
+        return math.dist(positions[label], positions[goal])
+    return heuristic
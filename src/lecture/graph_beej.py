@@ -29,22 +29,21 @@ b.edges = [c, d]
 
 # DEPTH FIRST TRAVERSAL
 def dft(node_in: GraphNode):
-    visited_nodes = set()
-
-    def dft_util(node):
-        nonlocal visited_nodes
-
-        if node in visited_nodes:
-            return
-
-        print(node.value)  # visit node
-
-        visited_nodes.add(node)
-
-        for edge in node.edges:  # visit neighbors
-            dft_util(edge)  # recurse with nodes in node.edges
-
-    dft_util(node_in)
+    visited_nodes = {node_in}
+    print(node_in.value)  # visit node
+
+    # in place of recursing into each neighbor, keep one iterator over node.edges
+    # for every node we are still inside -- a chain of any length won't hit the recursion limit
+    stack = [iter(node_in.edges)]
+    while stack:
+        for edge in stack[-1]:  # visit neighbors
+            if edge not in visited_nodes:
+                print(edge.value)  # visit node
+                visited_nodes.add(edge)
+                stack.append(iter(edge.edges))  # "recurse" with nodes in edge.edges
+                break
+        else:
+            stack.pop()  # all neighbors visited -- back up to the previous node
 
 
 # a -> b -> c -> d -> e
@@ -1,3 +1,6 @@
+from weighted import WeightedGraph
+
+
 class Vertex:
     def __init__(self, value):
         self.value = value
@@ -23,9 +26,12 @@ class Graph:
     def __init__(self):
         self.vertices = {}
         self.count = 0
+        self.version = 0  # bumped on every change so the weighted() snapshot goes stale
+        self._weighted = None
 
     def add_vertex(self, value):
         self.count += 1
+        self.version += 1
         new_vertex = Vertex(value)
         self.vertices[value] = new_vertex
         return new_vertex
@@ -41,10 +47,25 @@ class Graph:
 
         # add connection between vertex1 and vertex2 with the given weight
         self.vertices[vertex1].add_connection(self.vertices[vertex2], weight)
+        self.version += 1
 
     def get_vertices(self):
         return self.vertices
 
+    def weighted(self):
+        """Return a WeightedGraph snapshot of this graph, rebuilt only after add_vertex/add_edge change it."""
+        if self._weighted is None or self._weighted[0] != self.version:
+            self._weighted = (self.version, WeightedGraph.from_vertices(self.vertices))
+        return self._weighted[1]
+
+    def dijkstra(self, start, target=None, queue="heap"):
+        """Return a ShortestPaths mapping of label -> weighted distance from start (see weighted.py)."""
+        return self.weighted().dijkstra(start, target, queue)
+
+    def a_star(self, start, goal, heuristic=None):
+        """Return ShortestPaths from start that is exact for goal, guided by heuristic(label, goal)."""
+        return self.weighted().a_star(start, goal, heuristic)
+
 
 if __name__ == '__main__':
     g = Graph()
@@ -70,3 +91,7 @@ if __name__ == '__main__':
 
         # for w in v.get_connections():
         # print(f"({v.get_value()}, {w.get_value()})")
+
+    paths = g.dijkstra(0)
+    print(dict(paths))
+    print(paths.path(6))
@@ -1,23 +1,20 @@
 from room import Room
 from player import Player
 from world import World
-
-import random
-from ast import literal_eval
+from traversal import plan_traversal
 
 # Load world
 world = World()
 
 # You may uncomment the smaller graphs for development and testing purposes.
-map_file = "maps/test_line.txt"
+# map_file = "maps/test_line.txt"
 # map_file = "maps/test_cross.txt"
 # map_file = "maps/test_loop.txt"
 # map_file = "maps/test_loop_fork.txt"
-# map_file = "maps/main_maze.txt"  # FINAL MAP — your solution must be able to handle this
+map_file = "maps/main_maze.txt"  # FINAL MAP — your solution must be able to handle this
 
-# Loads the map into a dictionary
-room_graph = literal_eval(open(map_file, "r").read())
-world.load_graph(room_graph)
+# Streams the map file straight into the world (see maps.py)
+world.load_map(map_file)
 
 # Print an ASCII map
 world.print_rooms()
@@ -33,71 +30,13 @@ world.print_rooms()
 #
 ####################################
 player = Player(world.starting_room)
-traversal_path = []
-
-NORTH = "n"
-EAST = "e"
-SOUTH = "s"
-WEST = "w"
-
-opposite_directions = {
-    NORTH: SOUTH,
-    EAST: WEST,
-    SOUTH: NORTH,
-    WEST: EAST,
-}
-
-traversal_graph = {}
-
-# Start by writing an algorithm that
-#  - picks a random, unexplored direction from the players current room,
-#  - travels and LOGS that direction,
-#  - then loops.
-#
-# This should cause your player to walk a depth-first traversal.
-# When you reach a dead-end, walk back to the nearest room
-# that does contain an unexplored path
-count = 1
-
-current_room = 0
-
-print(room_graph)
-
-
-def dft_explore(last_room=None):
-    exits = player.current_room.get_exits()
-    viable_exits = []
-
-    for exit in exits:
-        if exit == "?":
-            # viable = True
-            viable_exits.append(exit)
-
-    if not viable_exits:
-        print("no unexplored exits")
-        return
-
-    if player.current_room.id not in traversal_graph:
-        traversal_graph[player.current_room.id] = {direction: "?" for direction in exits}
-        if last_room is not None:
-            traversal_graph[player.current_room.id][last_room[0]] = last_room[1]
-
-    # if "?" not in player.current_room.get_exits():
-    next_direction = random.choice(viable_exits)
-    # player.travel(next_direction)
-    traversal_path.append(next_direction)
-    dft_explore([player.current_room.id, next_direction])
-    print(next_direction)
-    print(traversal_graph)
-
-    # return
-
 
-dft_explore()
-print(traversal_graph)
-# print(f"current_room={player.current_room.description}")
-# print(f"current_room.id={player.current_room.id}")
-# print(f"current_room.get_exits()={player.current_room.get_exits()}")
+# Depth-first walk that saves the deepest branch for last and backtracks to the
+# nearest room with an unexplored exit (see traversal.py)
+traversal_path = plan_traversal(world)
+# or try many seeded plans across all CPUs and keep the shortest (see search.py):
+# from search import search_traversals
+# traversal_path = search_traversals(world, attempts=2000, target=950).path
 
 ####################################
 # TEST CODE
@@ -115,11 +54,11 @@ for move in traversal_path:
     player.travel(move)
     visited_rooms.add(player.current_room)
 
-if len(visited_rooms) == len(room_graph):
+if len(visited_rooms) == len(world.rooms):
     print(f"TESTS PASSED: {len(traversal_path)} moves, {len(visited_rooms)} rooms visited")
 else:
     print("TESTS FAILED: INCOMPLETE TRAVERSAL")
-    print(f"{len(room_graph) - len(visited_rooms)} unvisited rooms")
+    print(f"{len(world.rooms) - len(visited_rooms)} unvisited rooms")
 
 #######
 # UNCOMMENT TO WALK AROUND
@@ -0,0 +1,65 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class SparseGrid:
+    """
+    Sorted spatial index of room IDs by (x, y) coordinate.
+
+    Only occupied cells are stored. Rows are kept sorted by y, and each row's
+    x coordinates and room IDs are kept sorted in two parallel arrays, so
+    memory and build time scale with the number of rooms rather than with
+    the bounding box. Lookups and row ranges are binary searches.
+    """
+
+    def __init__(self, cells=()):
+        """Index an iterable of (x, y, room_id) cells."""
+        self.row_ys = array("q")  # occupied y values, ascending
+        self.row_xs = []  # per row: array of x values, ascending
+        self.row_ids = []  # per row: array of room IDs, parallel to row_xs
+        self.count = 0
+        self.max_x = self.max_y = -1
+        for x, y, room_id in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+            if not self.row_ys or self.row_ys[-1] != y:
+                self.row_ys.append(y)
+                self.row_xs.append(array("q"))
+                self.row_ids.append(array("q"))
+            self.row_xs[-1].append(x)
+            self.row_ids[-1].append(room_id)
+            self.count += 1
+            self.max_x = max(self.max_x, x)
+            self.max_y = max(self.max_y, y)
+
+    @classmethod
+    def from_rooms(cls, rooms):
+        """Index every room in a room_id -> room mapping by its coordinates."""
+        return cls((room.x, room.y, room.id) for room in rooms.values())
+
+    def __len__(self):
+        return self.count
+
+    def get(self, x, y, default=None):
+        """Return the room ID at (x, y), or default if that cell is empty."""
+        row = bisect_left(self.row_ys, y)
+        if row < len(self.row_ys) and self.row_ys[row] == y:
+            xs = self.row_xs[row]
+            i = bisect_left(xs, x)
+            if i < len(xs) and xs[i] == x:
+                return self.row_ids[row][i]
+        return default
+
+    def rows(self, min_x=None, max_x=None, min_y=None, max_y=None):
+        """
+        Yield (y, [(x, room_id), ...]) for each occupied row, from the top (highest y) down.
+
+        Only cells inside the optional bounds (inclusive) are included, and rows
+        with no cells inside them are skipped.
+        """
+        first = 0 if min_y is None else bisect_left(self.row_ys, min_y)
+        last = len(self.row_ys) if max_y is None else bisect_right(self.row_ys, max_y)
+        for row in range(last - 1, first - 1, -1):
+            xs = self.row_xs[row]
+            start = 0 if min_x is None else bisect_left(xs, min_x)
+            end = len(xs) if max_x is None else bisect_right(xs, max_x)
+            if start < end:
+                yield self.row_ys[row], list(zip(xs[start:end], self.row_ids[row][start:end]))
@@ -0,0 +1,88 @@
+"""
+Fast loading for adventure map files.
+
+Map text files look like
+
+    {
+      0: [(3, 5), {'n': 1, 's': 5}],
+      1: [(3, 6), {'s': 0}],
+    }
+
+iter_rooms() streams (room_id, x, y, exits) records out of them with a
+regular-expression tokenizer that reads the file in chunks, so nothing
+is ever handed to literal_eval. compile_map() saves the same records as
+JSON, which loads even faster. World.load_rooms() builds a world from
+the records in a single pass.
+"""
+import json
+import re
+
+# one room entry: id: [(x, y), {exits}]
+_ROOM = re.compile(r"(-?\d+)\s*:\s*\[\s*\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)\s*,\s*\{([^}]*)\}\s*\]")
+# one exit inside the braces: 'n': 12
+_EXIT = re.compile(r"""['"]([nsew])['"]\s*:\s*(-?\d+)""")
+# all that may appear between room entries (and around the exits inside one)
+_SEPARATORS = re.compile(r"[\s,{}]*")
+
+CHUNK_SIZE = 1 << 16
+
+
+def iter_rooms(map_file):
+    """Yield (room_id, x, y, exits) for every room in a map text file or a compile_map() JSON file."""
+    if map_file.endswith(".json"):
+        with open(map_file) as compiled:
+            for room_id, x, y, exits in json.load(compiled):
+                yield room_id, x, y, exits
+        return
+
+    with open(map_file) as text:
+        buffer = ""
+        offset = 0  # position of buffer[0] in the file
+        while True:
+            chunk = text.read(CHUNK_SIZE)
+            buffer += chunk
+            consumed = 0
+            for match in _ROOM.finditer(buffer):
+                # finditer skips anything it can't parse, so make sure that was only separators
+                _check_separators(map_file, buffer, consumed, match.start(), offset)
+                room_id, x, y, exits = match.groups()
+                yield int(room_id), int(x), int(y), _parse_exits(map_file, exits, offset + match.start(4))
+                consumed = match.end()
+            # keep any half-read room for the next chunk
+            buffer = buffer[consumed:]
+            offset += consumed
+            if not chunk:
+                break
+    _check_separators(map_file, buffer, 0, None, offset)
+
+
+def _parse_exits(map_file, exits, offset):
+    """Return the {direction: room_id} dict for the text inside one room's exit braces."""
+    parsed = {}
+    consumed = 0
+    for match in _EXIT.finditer(exits):
+        _check_separators(map_file, exits, consumed, match.start(), offset)
+        parsed[match.group(1)] = int(match.group(2))
+        consumed = match.end()
+    _check_separators(map_file, exits, consumed, None, offset)
+    return parsed
+
+
+def _check_separators(map_file, text, start, end, offset):
+    """Raise ValueError unless text[start:end] is only whitespace, commas and braces."""
+    end = len(text) if end is None else end
+    separators = _SEPARATORS.match(text, start, end)
+    if separators.end() != end:
+        bad = separators.end()
+        raise ValueError(f"could not parse {map_file} at offset {offset + bad}: {text[bad:bad + 80]!r}")
+
+
+def load_room_graph(map_file):
+    """Return the map as the {room_id: [(x, y), exits]} dict literal_eval would have produced."""
+    return {room_id: [(x, y), exits] for room_id, x, y, exits in iter_rooms(map_file)}
+
+
+def compile_map(map_file, compiled_file):
+    """Save a map text file as JSON records that iter_rooms() can load without tokenizing."""
+    with open(compiled_file, "w") as compiled:
+        json.dump([list(room) for room in iter_rooms(map_file)], compiled, separators=(",", ":"))
@@ -0,0 +1,104 @@
+"""
+Streaming ASCII renderer for a World.
+
+MapRenderer yields the map one line at a time, so output can start before
+the whole map is drawn. It can crop to a viewport around a coordinate, and
+for live visualizations it can redraw only the rows containing rooms that
+changed since the last frame (ANSI cursor moves on a terminal stream).
+"""
+BORDER = "#####"
+BLANK_CELL = "     "
+
+
+class MapRenderer:
+    def __init__(self, world):
+        self.world = world
+        self.row_lines = {}  # y -> screen line of that row's first text line, in the last full frame
+        self.frame_bounds = None  # (min_x, max_x, min_y, max_y) of the last full frame
+
+    def iter_lines(self, center=None, radius=None, highlight=None):
+        """
+        Yield the lines of the map, top row first, in the same layout as World.print_rooms.
+
+        With center=(x, y) and radius, only rooms within radius columns and rows of
+        center are drawn. highlight is a room ID drawn as "@" (e.g. the player's room).
+        """
+        min_x, max_x, min_y, max_y = self._bounds(center, radius)
+        yield BORDER
+        for y, row in self.world.room_index.rows(min_x, max_x, min_y, max_y):
+            yield from self.render_row(row, min_x, max_x, highlight)
+        yield ""
+        yield BORDER
+
+    def render(self, stream, center=None, radius=None, highlight=None):
+        """Write the map to stream row by row and remember where each row landed for render_changed."""
+        min_x, max_x, min_y, max_y = self.frame_bounds = self._bounds(center, radius)
+        self.row_lines = {}
+        stream.write(BORDER + "\n")
+        line_number = 1
+        for y, row in self.world.room_index.rows(min_x, max_x, min_y, max_y):
+            self.row_lines[y] = line_number
+            for line in self.render_row(row, min_x, max_x, highlight):
+                stream.write(line + "\n")
+            line_number += 3
+        stream.write("\n" + BORDER + "\n")
+        _flush(stream)
+
+    def render_changed(self, stream, room_ids, highlight=None):
+        """
+        Redraw only the rows holding room_ids, in place, on a terminal that was drawn with render().
+
+        The last render() call must have started at the top-left of the screen. Rows
+        outside that frame are ignored. Returns how many rows were redrawn.
+        """
+        if self.frame_bounds is None:
+            raise ValueError("render() must draw a full frame before render_changed()")
+        min_x, max_x, min_y, max_y = self.frame_bounds
+        rooms = self.world.rooms
+        ys = {rooms[room_id].y for room_id in room_ids}
+        redrawn = 0
+        for y in sorted(ys, reverse=True):
+            if y not in self.row_lines:
+                continue
+            row = next(self.world.room_index.rows(min_x, max_x, y, y))[1]
+            for offset, line in enumerate(self.render_row(row, min_x, max_x, highlight)):
+                # move the cursor to the start of the line (1-based), draw it, then restore the cursor
+                stream.write(f"\x1b7\x1b[{self.row_lines[y] + offset + 1};1H{line}\x1b8")
+            redrawn += 1
+        _flush(stream)
+        return redrawn
+
+    def render_row(self, row, min_x, max_x, highlight=None):
+        """Return the three text lines for one row of (x, room_id) cells between columns min_x and max_x."""
+        rooms = self.world.rooms
+        north, middle, south = ["#"], ["#"], ["#"]
+        next_x = min_x
+        for x, room_id in row:
+            room = rooms[room_id]
+            # empty cells are five blanks on all three lines, so only the gaps between rooms need counting
+            gap = BLANK_CELL * (x - next_x)
+            north.append(gap)
+            middle.append(gap)
+            south.append(gap)
+            north.append("  |  " if room.n_to is not None else BLANK_CELL)
+            middle.append("-" if room.w_to is not None else " ")
+            middle.append(" @ " if room_id == highlight else f"{room_id}".zfill(3))
+            middle.append("-" if room.e_to is not None else " ")
+            south.append("  |  " if room.s_to is not None else BLANK_CELL)
+            next_x = x + 1
+        gap = BLANK_CELL * (max_x + 1 - next_x) + "#"
+        return ["".join(north) + gap, "".join(middle) + gap, "".join(south) + gap]
+
+    def _bounds(self, center, radius):
+        if center is None:
+            return 0, self.world.grid_size - 1, None, None
+        if radius is None:
+            raise ValueError("a viewport center needs a radius")
+        x, y = center
+        return x - radius, x + radius, y - radius, y + radius
+
+
+def _flush(stream):
+    flush = getattr(stream, "flush", None)
+    if flush is not None:
+        flush()
@@ -1,16 +1,23 @@
-# Implement a class to hold room information. This should have name and
-# description attributes.
-class Room:
-    def __init__(self, name, description, id=0, x=None, y=None):
-        self.id = id
-        self.name = name
-        self.description = description
-        self.n_to = None
-        self.s_to = None
-        self.e_to = None
-        self.w_to = None
-        self.x = x
-        self.y = y
+from array import array
+from collections.abc import Mapping
+
+DIRECTIONS = "nsew"
+DIRECTION_INDEX = {"n": 0, "s": 1, "e": 2, "w": 3}
+OPPOSITE_INDEX = (1, 0, 3, 2)  # s, n, w, e
+NO_ROOM = -1
+
+
+class BaseRoom:
+    """Room behaviour shared by Room and RoomView; subclasses provide the attributes it reads."""
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return f"Room {self.id}"
+
+    @property
+    def description(self):
+        return f"({self.x},{self.y})"
 
     def __str__(self):
         return f"\n-------------------\n\n{self.name}\n\n   {self.description}\n\n{self.get_exits_string()}\n"
@@ -64,3 +71,170 @@ class Room:
 
     def get_coords(self):
         return [self.x, self.y]
+
+
+# Implement a class to hold room information. This should have name and
+# description attributes.
+class Room(BaseRoom):
+    # __slots__ instead of a per-room __dict__; name and description are only
+    # formatted when read unless they were given explicitly
+    __slots__ = ("id", "_name", "_description", "n_to", "s_to", "e_to", "w_to", "x", "y")
+
+    def __init__(self, name, description, id=0, x=None, y=None):
+        self.id = id
+        self._name = name
+        self._description = description
+        self.n_to = None
+        self.s_to = None
+        self.e_to = None
+        self.w_to = None
+        self.x = x
+        self.y = y
+
+    @property
+    def name(self):
+        return self._name if self._name is not None else super().name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def description(self):
+        return self._description if self._description is not None else super().description
+
+    @description.setter
+    def description(self, description):
+        self._description = description
+
+
+class RoomTable(Mapping):
+    """
+    Struct-of-arrays storage for a whole world of rooms.
+
+    Room IDs index straight into int32 arrays of x and y coordinates and of
+    exits (four per room, in DIRECTIONS order, NO_ROOM where there is no exit),
+    so IDs should be dense. That is roughly 24 bytes per room instead of a
+    Room object. Reading table[room_id] returns a lightweight RoomView that
+    Player and the traversal code can use in place of a Room.
+    """
+
+    def __init__(self):
+        self.xs = array("i")
+        self.ys = array("i")
+        self.exits = array("i")
+        self.present = bytearray()  # 1 for every ID that has been given a room
+        self.count = 0
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a table in one pass over (room_id, x, y, exits) records (see maps.iter_rooms)."""
+        table = cls()
+        for room_id, x, y, exits in records:
+            table.add_room(room_id, x, y)
+            for direction, target_id in exits.items():
+                table.connect(room_id, direction, target_id)
+        for target_id in table.exits:
+            if target_id != NO_ROOM and not table.present[target_id]:
+                raise ValueError(f"room {target_id} is the target of an exit but has no entry in the map")
+        return table
+
+    def add_room(self, room_id, x, y):
+        _check_id(room_id)
+        self._grow(room_id)
+        if not self.present[room_id]:
+            self.present[room_id] = 1
+            self.count += 1
+        self.xs[room_id] = x
+        self.ys[room_id] = y
+
+    def connect(self, room_id, direction, target_id):
+        """Link room_id to target_id through direction, and target_id back through the opposite one."""
+        _check_id(room_id)
+        _check_id(target_id)
+        self._grow(max(room_id, target_id))
+        direction = DIRECTION_INDEX[direction]
+        self.exits[4 * room_id + direction] = target_id
+        self.exits[4 * target_id + OPPOSITE_INDEX[direction]] = room_id
+
+    def exit_id(self, room_id, direction):
+        """Return the ID of the room through direction, or NO_ROOM."""
+        return self.exits[4 * room_id + DIRECTION_INDEX[direction]]
+
+    def __getitem__(self, room_id):
+        if 0 <= room_id < len(self.present) and self.present[room_id]:
+            return RoomView(self, room_id)
+        raise KeyError(room_id)
+
+    def __iter__(self):
+        present = self.present
+        return (room_id for room_id in range(len(present)) if present[room_id])
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, room_id):
+        missing = room_id + 1 - len(self.present)
+        if missing > 0:
+            self.xs.extend(array("i", [0]) * missing)
+            self.ys.extend(array("i", [0]) * missing)
+            self.exits.extend(array("i", [NO_ROOM]) * (4 * missing))
+            self.present.extend(bytes(missing))
+
+
+def _check_id(room_id):
+    # IDs index straight into the arrays, where a negative one would wrap around to another room
+    if room_id < 0:
+        raise ValueError(f"room IDs in a RoomTable must not be negative, got {room_id}")
+
+
+class RoomView(BaseRoom):
+    """A room read out of a RoomTable; equal to any other view of the same room."""
+    __slots__ = ("table", "id")
+
+    def __init__(self, table, room_id):
+        self.table = table
+        self.id = room_id
+
+    def __eq__(self, other):
+        return isinstance(other, RoomView) and other.id == self.id and other.table is self.table
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"RoomView({self.id})"
+
+    @property
+    def x(self):
+        return self.table.xs[self.id]
+
+    @property
+    def y(self):
+        return self.table.ys[self.id]
+
+    def get_room_in_direction(self, direction):
+        if direction in DIRECTION_INDEX:
+            room_id = self.table.exit_id(self.id, direction)
+            if room_id != NO_ROOM:
+                return RoomView(self.table, room_id)
+        return None
+
+    def get_exits(self):
+        exits = self.table.exits
+        base = 4 * self.id
+        # same order as Room.get_exits: n, s, w, e
+        return [direction for direction, offset in (("n", 0), ("s", 1), ("w", 3), ("e", 2))
+                if exits[base + offset] != NO_ROOM]
+
+    def connect_rooms(self, direction, connecting_room):
+        if direction in DIRECTION_INDEX:
+            self.table.connect(self.id, direction, connecting_room.id)
+        else:
+            print("INVALID ROOM CONNECTION")
+
+    # n_to/s_to/e_to/w_to read like Room's attributes
+    n_to = property(lambda self: self.get_room_in_direction("n"))
+    s_to = property(lambda self: self.get_room_in_direction("s"))
+    e_to = property(lambda self: self.get_room_in_direction("e"))
+    w_to = property(lambda self: self.get_room_in_direction("w"))
@@ -0,0 +1,153 @@
+"""
+Search many seeded traversal plans in parallel and keep the shortest.
+
+Different seeds break ties between equally weighted branches differently
+(see traversal.plan_traversal), and some of those plans are shorter than
+others. search_traversals() farms batches of seeds out to a process pool.
+The maze is handed to the workers once: on platforms that fork, they
+inherit it from the parent copy-on-write instead of unpickling a copy.
+Every plan is replayed against the maze before it can win.
+
+    python search.py maps/main_maze.txt 5000 950
+"""
+import multiprocessing
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from traversal import plan_walk, room_exits
+
+TraversalSearch = namedtuple("TraversalSearch", "path seed attempts seconds attempts_per_second")
+
+BATCH_SIZE = 16  # seeds per task; large enough to amortize the round trip, small enough to stop early
+
+
+def search_traversals(world, attempts=1000, target=None, workers=None, first_seed=0):
+    """
+    Plan `attempts` seeded traversals of world and return the shortest valid one as a TraversalSearch.
+
+    Seeds first_seed, first_seed + 1, ... are tried across `workers` processes
+    (default: one per CPU; 1 runs everything in this process). Once a plan of
+    target moves or fewer turns up, the search stops early and
+    TraversalSearch.attempts counts only the plans that were actually made.
+    """
+    exits = room_exits(world)
+    start = world.starting_room.id
+    seeds = range(first_seed, first_seed + attempts)
+    batches = [seeds[i:i + BATCH_SIZE] for i in range(0, attempts, BATCH_SIZE)]
+    workers = workers or os.cpu_count() or 1
+
+    began = time.perf_counter()
+    if workers == 1 or len(batches) == 1:
+        results = _search_here(exits, start, batches, target)
+    else:
+        results = _search_pool(exits, start, batches, target, workers)
+    seconds = time.perf_counter() - began
+
+    best_path, best_seed, done = None, None, 0
+    for path, seed, count in results:
+        done += count
+        if path is not None and (best_path is None or (len(path), seed) < (len(best_path), best_seed)):
+            best_path, best_seed = path, seed
+    return TraversalSearch(best_path, best_seed, done, seconds, done / seconds if seconds else float("inf"))
+
+
+def _search_here(exits, start, batches, target):
+    results = []
+    for seeds in batches:
+        results.append(_best_of(exits, start, seeds, target))
+        if _reached(results[-1], target):
+            break
+    return results
+
+
+def _search_pool(exits, start, batches, target, workers):
+    global _worker_exits, _worker_start
+    if "fork" in multiprocessing.get_all_start_methods():
+        # the children inherit these module globals; nothing is pickled
+        _worker_exits, _worker_start = exits, start
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=_init_search_worker, initargs=(exits, start))
+
+    results = []
+    pending = set()
+    remaining = iter(batches)
+    try:
+        while True:
+            # keep a couple of batches queued per worker, so stopping early wastes little work
+            for seeds in remaining:
+                pending.add(pool.submit(_best_of_worker, seeds, target))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results.extend(future.result() for future in finished)
+            if any(_reached(result, target) for result in results):
+                break
+    finally:
+        pool.shutdown(cancel_futures=True)
+        _worker_exits = _worker_start = None
+    # batches that were already running when we stopped still count
+    results.extend(future.result() for future in pending if not future.cancelled())
+    return results
+
+
+def _reached(result, target):
+    path = result[0]
+    return target is not None and path is not None and len(path) <= target
+
+
+_worker_exits = None
+_worker_start = None
+
+
+def _init_search_worker(exits, start):
+    global _worker_exits, _worker_start
+    _worker_exits, _worker_start = exits, start
+
+
+def _best_of_worker(seeds, target):
+    return _best_of(_worker_exits, _worker_start, seeds, target)
+
+
+def _best_of(exits, start, seeds, target):
+    """Return (shortest valid path or None, its seed, plans made) for one batch of seeds."""
+    best_path, best_seed, count = None, None, 0
+    for seed in seeds:
+        path = plan_walk(exits, start, seed)
+        count += 1
+        if is_complete(exits, start, path) and (best_path is None or len(path) < len(best_path)):
+            best_path, best_seed = path, seed
+            if target is not None and len(path) <= target:
+                break
+    return best_path, best_seed, count
+
+
+def is_complete(exits, start, path):
+    """Return True if walking path from start only uses real exits and visits every room in exits."""
+    visited = {start}
+    room = start
+    for direction in path:
+        room = exits[room].get(direction)
+        if room is None:
+            return False
+        visited.add(room)
+    return len(visited) == len(exits)
+
+
+if __name__ == "__main__":
+    from world import World
+
+    map_file = sys.argv[1] if len(sys.argv) > 1 else "maps/main_maze.txt"
+    attempts = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    target = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    world = World()
+    world.load_map(map_file)
+    search = search_traversals(world, attempts, target)
+    print(f"best: {len(search.path)} moves (seed {search.seed})")
+    print(f"{search.attempts} attempts in {search.seconds:.2f}s, {search.attempts_per_second:.0f} attempts/s")
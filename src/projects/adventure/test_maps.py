@@ -0,0 +1,75 @@
+import glob
+import os
+import tempfile
+import unittest
+from ast import literal_eval
+
+import maps
+from maps import compile_map, load_room_graph
+from world import World
+
+MAP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+MAP_FILES = sorted(glob.glob(os.path.join(MAP_DIR, "*.txt")))
+
+
+class MapsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_map(self, text, name="map.txt"):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w") as map_file:
+            map_file.write(text)
+        return path
+
+    def test_matches_literal_eval(self):
+        self.assertTrue(MAP_FILES)
+        for map_file in MAP_FILES:
+            with open(map_file) as text:
+                expected = literal_eval(text.read())
+            self.assertEqual(load_room_graph(map_file), expected, map_file)
+
+            compiled = os.path.join(self.tmp.name, "compiled.json")
+            compile_map(map_file, compiled)
+            self.assertEqual(load_room_graph(compiled), expected, map_file)
+
+    def test_entries_split_across_chunks(self):
+        chunk_size = maps.CHUNK_SIZE
+        maps.CHUNK_SIZE = 7  # shorter than any room entry
+        try:
+            for map_file in MAP_FILES:
+                with open(map_file) as text:
+                    self.assertEqual(load_room_graph(map_file), literal_eval(text.read()), map_file)
+        finally:
+            maps.CHUNK_SIZE = chunk_size
+
+    def test_malformed_entry(self):
+        # room 1 is missing the comma after its coordinates
+        map_file = self.write_map("{\n  0: [(3, 5), {'n': 1}],\n  1: [(3, 6) {'s': 0}],\n  2: [(3, 7), {}]\n}")
+        with self.assertRaisesRegex(ValueError, "offset 29"):
+            load_room_graph(map_file)
+
+    def test_unknown_exit(self):
+        map_file = self.write_map("{\n  0: [(3, 5), {'n': 1, 'up': 1}],\n  1: [(3, 6), {'s': 0}]\n}")
+        with self.assertRaisesRegex(ValueError, "'up'"):
+            load_room_graph(map_file)
+
+    def test_missing_room(self):
+        map_file = self.write_map("{\n  0: [(3, 5), {'n': 1}],\n  1: [(3, 6), {'s': 0, 'e': 7}]\n}")
+        for compact in (False, True):
+            with self.assertRaisesRegex(ValueError, "room 7"):
+                World().load_map(map_file, compact)
+
+    def test_negative_room_id(self):
+        for text in ("{\n  0: [(1, 1), {'n': 1}],\n  1: [(1, 2), {'s': 0}],\n  -1: [(5, 5), {}]\n}",
+                     "{\n  0: [(1, 1), {'n': -1}],\n  -1: [(1, 2), {'s': 0}]\n}"):
+            map_file = self.write_map(text)
+            with self.assertRaisesRegex(ValueError, "-1"):
+                World().load_map(map_file, compact=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
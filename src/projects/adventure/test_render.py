@@ -0,0 +1,88 @@
+import glob
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+
+from render import MapRenderer
+from world import World
+
+MAP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+
+
+def original_print_rooms(world):
+    """What World.print_rooms printed before MapRenderer: every row of a dense grid_size x grid_size grid."""
+    size = world.grid_size
+    grid = [[None] * size for _ in range(size)]
+    for room in world.rooms.values():
+        grid[room.x][room.y] = room
+    text = ""
+    for y in range(size - 1, -1, -1):
+        row = [grid[x][y] for x in range(size)]
+        if all(room is None for room in row):
+            continue
+        text += "#" + "".join("  |  " if room is not None and room.n_to is not None else "     " for room in row) + "#\n"
+        text += "#" + "".join(
+            ("-" if room is not None and room.w_to is not None else " ")
+            + (f"{room.id}".zfill(3) if room is not None else "   ")
+            + ("-" if room is not None and room.e_to is not None else " ")
+            for room in row
+        ) + "#\n"
+        text += "#" + "".join("  |  " if room is not None and room.s_to is not None else "     " for room in row) + "#\n"
+    return "#####\n" + text + "\n#####\n"
+
+
+class RenderTest(unittest.TestCase):
+    def load(self, name, compact=False):
+        world = World()
+        world.load_map(os.path.join(MAP_DIR, name), compact)
+        return world
+
+    def test_matches_original_print_rooms(self):
+        map_files = sorted(glob.glob(os.path.join(MAP_DIR, "*.txt")))
+        self.assertTrue(map_files)
+        for map_file in map_files:
+            for compact in (False, True):
+                world = self.load(os.path.basename(map_file), compact)
+                printed = io.StringIO()
+                with redirect_stdout(printed):
+                    world.print_rooms()
+                self.assertEqual(printed.getvalue(), original_print_rooms(world), map_file)
+                self.assertEqual("\n".join(MapRenderer(world).iter_lines()) + "\n", printed.getvalue())
+
+    def test_viewport(self):
+        world = self.load("main_maze.txt")
+        center, radius = (10, 10), 3
+        text = "\n".join(MapRenderer(world).iter_lines(center, radius, highlight=world.starting_room.id))
+        for room in world.rooms.values():
+            inside = abs(room.x - center[0]) <= radius and abs(room.y - center[1]) <= radius
+            label = " @ " if room.id == world.starting_room.id else f"{room.id}".zfill(3)
+            self.assertEqual(label in text, inside, room.id)
+        # every line is the viewport's width: 2 * radius + 1 cells of 5 characters, plus the borders
+        self.assertTrue(all(len(line) == 5 * (2 * radius + 1) + 2 for line in text.split("\n")[1:-2]))
+        with self.assertRaises(ValueError):
+            world.print_rooms(center=center)
+
+    def test_render_changed(self):
+        world = self.load("test_loop_fork.txt")
+        renderer = MapRenderer(world)
+        with self.assertRaises(ValueError):
+            renderer.render_changed(io.StringIO(), [0])
+
+        frame = io.StringIO()
+        renderer.render(frame)
+        self.assertEqual(frame.getvalue(), "\n".join(renderer.iter_lines()) + "\n")
+
+        update = io.StringIO()
+        room = world.rooms[1]
+        same_row = [other.id for other in world.rooms.values() if other.y == room.y]
+        self.assertEqual(renderer.render_changed(update, same_row, highlight=1), 1)
+        lines = frame.getvalue().split("\n")
+        row = renderer.row_lines[room.y]
+        # three lines redrawn in place, at the row's position in the frame (1-based)
+        self.assertEqual(update.getvalue().count("\x1b7"), 3)
+        self.assertIn(f"\x1b[{row + 2};1H{lines[row + 1].replace('001', ' @ ')}\x1b8", update.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import unittest
+
+from search import is_complete, search_traversals
+from traversal import room_exits
+from world import World
+
+MAP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+
+
+class SearchTest(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+        self.world.load_map(os.path.join(MAP_DIR, "test_loop_fork.txt"))
+        self.exits = room_exits(self.world)
+
+    def test_search(self):
+        for workers in (1, 2):
+            search = search_traversals(self.world, attempts=40, workers=workers)
+            self.assertEqual(search.attempts, 40)
+            self.assertTrue(is_complete(self.exits, self.world.starting_room.id, search.path))
+            self.assertGreater(search.attempts_per_second, 0)
+        # the same seeds give the same best plan however they are split between processes
+        alone = search_traversals(self.world, attempts=40, workers=1)
+        pooled = search_traversals(self.world, attempts=40, workers=2)
+        self.assertEqual((pooled.path, pooled.seed), (alone.path, alone.seed))
+
+    def test_target_stops_early(self):
+        for workers in (1, 2):
+            # every plan of this maze meets the target, so the search stops almost at once
+            search = search_traversals(self.world, attempts=5000, target=100, workers=workers)
+            self.assertLessEqual(len(search.path), 100)
+            self.assertLess(search.attempts, 5000)
+        self.assertEqual(search_traversals(self.world, attempts=5000, target=100, workers=1).attempts, 1)
+
+    def test_is_complete(self):
+        start = self.world.starting_room.id
+        self.assertFalse(is_complete(self.exits, start, []))
+        self.assertFalse(is_complete(self.exits, start, ["x"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import glob
+import os
+import random
+import unittest
+
+from search import is_complete
+from traversal import branch_weights, plan_traversal, plan_walk, room_exits
+from world import World
+
+MAP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+OFFSETS = {"n": (0, 1), "s": (0, -1), "e": (1, 0), "w": (-1, 0)}
+OPPOSITE_DIRECTIONS = {"n": "s", "s": "n", "e": "w", "w": "e"}
+
+
+def tree_maze(width, height, seed):
+    """Return {room_id: {direction: room_id}} for a random spanning tree of a width x height grid."""
+    rng = random.Random(seed)
+    exits = {room_id: {} for room_id in range(width * height)}
+    visited = {0}
+    stack = [0]
+    while stack:
+        room = stack[-1]
+        x, y = room % width, room // width
+        options = [(direction, (x + dx) + (y + dy) * width) for direction, (dx, dy) in OFFSETS.items()
+                   if 0 <= x + dx < width and 0 <= y + dy < height and (x + dx) + (y + dy) * width not in visited]
+        if not options:
+            stack.pop()
+            continue
+        direction, next_room = rng.choice(options)
+        exits[room][direction] = next_room
+        exits[next_room][OPPOSITE_DIRECTIONS[direction]] = room
+        visited.add(next_room)
+        stack.append(next_room)
+    return exits
+
+
+class TraversalTest(unittest.TestCase):
+    def test_every_map(self):
+        map_files = sorted(glob.glob(os.path.join(MAP_DIR, "*.txt")))
+        self.assertTrue(map_files)
+        for map_file in map_files:
+            world = World()
+            world.load_map(map_file)
+            exits = room_exits(world)
+            for seed in (None, 1, 2):
+                path = plan_traversal(world, seed)
+                self.assertTrue(is_complete(exits, world.starting_room.id, path), (map_file, seed))
+            if map_file.endswith("main_maze.txt"):
+                self.assertLess(len(plan_traversal(world)), 970)
+
+    def test_tree_optimum(self):
+        # on a tree every edge is walked twice, except those on the way to the room the walk ends in
+        for seed in range(5):
+            exits = tree_maze(12, 9, seed)
+            path = plan_walk(exits, 0, seed if seed else None)
+            self.assertTrue(is_complete(exits, 0, path))
+            deepest = branch_weights(exits, 0)[0][0]
+            self.assertEqual(len(path), 2 * (len(exits) - 1) - deepest)
+
+    def test_large_maze(self):
+        # a random depth-first maze has corridors thousands of rooms long -- far past the recursion limit
+        exits = tree_maze(150, 150, 7)
+        path = plan_walk(exits, 0)
+        self.assertTrue(is_complete(exits, 0, path))
+        self.assertGreater(branch_weights(exits, 0)[0][0], 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
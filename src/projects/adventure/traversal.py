@@ -0,0 +1,143 @@
+"""
+Plan a short walk that visits every room in a World.
+
+The planner walks depth-first from the starting room. At each room it takes
+the unexplored exit whose branch (in a BFS spanning tree rooted at the
+start) is shallowest and smallest, so the deepest branch comes last and is
+never walked back out of -- on a tree-shaped maze that is the optimal
+route-inspection walk, 2 * (rooms - 1) minus the depth of the farthest room.
+At a dead end it walks to the nearest room that still has an unexplored
+exit, which lets loops in the maze act as shortcuts.
+
+Everything is iterative. Weighing the branches is one BFS plus a sort of
+each room's exits, and each backtracking search visits at most a constant
+multiple of the rooms on the route it would otherwise take, so a plan costs
+O(rooms log rooms) on the maze shapes used here.
+"""
+import random
+from collections import deque
+
+SHORTCUT_BUDGET = 8  # rooms a backtracking search may visit per step of the way back
+
+
+def room_exits(world):
+    """Return {room_id: {direction: neighbor_id}} for every room in world."""
+    return {
+        room_id: {direction: room.get_room_in_direction(direction).id for direction in room.get_exits()}
+        for room_id, room in world.rooms.items()
+    }
+
+
+def plan_traversal(world, seed=None):
+    """
+    Return a list of directions that visits every room reachable from world.starting_room.
+
+    seed randomizes the order of equally weighted branches (None keeps exit order),
+    so different seeds give different valid plans, some shorter than others.
+    """
+    return plan_walk(room_exits(world), world.starting_room.id, seed)
+
+
+def plan_walk(exits, start, seed=None):
+    """plan_traversal() over a {room_id: {direction: neighbor_id}} adjacency."""
+    rng = random.Random(seed) if seed is not None else None
+    weight = branch_weights(exits, start)
+
+    came_from = {start: None}  # every room we've been to -> the room we first entered it from
+    path = []
+    current = start
+    while True:
+        options = [(direction, room) for direction, room in exits[current].items() if room not in came_from]
+        if options:
+            if rng is not None:
+                rng.shuffle(options)
+            # shallow, small branches first: the deepest one is left for last and never walked back out of
+            options.sort(key=lambda option: weight[option[1]])
+            direction, room = options[0]
+            path.append(direction)
+            came_from[room] = current
+            current = room
+            continue
+
+        # dead end -- walk back to the nearest room that still has an unexplored exit
+        route = _route_to_unexplored(exits, current, came_from)
+        if route is None:
+            return path
+        for room, next_room in zip(route, route[1:]):
+            path.append(_direction(exits, room, next_room))
+        current = route[-1]
+
+
+def branch_weights(exits, start):
+    """
+    Return {room_id: (height, size)} of each room's subtree in a BFS spanning tree rooted at start.
+
+    plan_walk() takes the lightest unexplored branch first, so the branches it
+    finishes early (and has to walk back out of) are the short, small ones.
+    """
+    parent = {start: None}
+    order = [start]
+    for room in order:  # order grows as we go -- a queue that is never popped
+        for neighbor in exits[room].values():
+            if neighbor not in parent:
+                parent[neighbor] = room
+                order.append(neighbor)
+    height = dict.fromkeys(order, 0)
+    size = dict.fromkeys(order, 1)
+    for room in reversed(order):
+        up = parent[room]
+        if up is not None:
+            height[up] = max(height[up], height[room] + 1)
+            size[up] += size[room]
+    return {room: (height[room], size[room]) for room in order}
+
+
+def _has_unexplored(exits, room, came_from):
+    for neighbor in exits[room].values():
+        if neighbor not in came_from:
+            return True
+    return False
+
+
+def _route_to_unexplored(exits, source, came_from):
+    """
+    Return the rooms from source to the nearest room with an unexplored exit, or None if there are none.
+
+    The way we came in (following came_from back) gives a route of some length k.
+    A BFS through the whole maze then looks for something closer, but visits at
+    most SHORTCUT_BUDGET * k rooms, so backtracking stays linear in the walk length.
+    """
+    route = [source]
+    while route[-1] is not None and not _has_unexplored(exits, route[-1], came_from):
+        route.append(came_from[route[-1]])
+    if route[-1] is None:
+        # the rooms we came through are all explored; fall back to an unbounded search
+        route, budget = None, None
+    else:
+        budget = SHORTCUT_BUDGET * (len(route) - 1)
+
+    parents = {source: None}
+    q = deque([(source, 0)])
+    while q:
+        room, distance = q.popleft()
+        if route is not None and (distance >= len(route) - 1 or budget <= 0):
+            break  # anything further is no better than the way we came
+        if _has_unexplored(exits, room, came_from) and room != source:
+            nearest = [room]
+            while parents[nearest[-1]] is not None:
+                nearest.append(parents[nearest[-1]])
+            return nearest[::-1]
+        for neighbor in exits[room].values():
+            if neighbor not in parents and neighbor in came_from:
+                parents[neighbor] = room
+                q.append((neighbor, distance + 1))
+                if budget is not None:
+                    budget -= 1
+    return route
+
+
+def _direction(exits, room, next_room):
+    for direction, neighbor in exits[room].items():
+        if neighbor == next_room:
+            return direction
+    raise ValueError(f"room {room} has no exit to room {next_room}")
@@ -1,88 +1,70 @@
-from room import Room
+import sys
+
+from grid import SparseGrid
+from maps import iter_rooms
+from render import MapRenderer
+from room import Room, RoomTable
+
+EXIT_ATTRIBUTES = {"n": "n_to", "s": "s_to", "e": "e_to", "w": "w_to"}
+OPPOSITE_DIRECTIONS = {"n": "s", "s": "n", "e": "w", "w": "e"}
 
 
 class World:
     def __init__(self):
         self.starting_room = None
         self.rooms = {}
-        self.room_grid = []
+        self.room_index = SparseGrid()  # room IDs by (x, y); only occupied cells are stored
         self.grid_size = 0
 
     def load_graph(self, room_graph):
-        num_rooms = len(room_graph)
-        rooms = [None] * num_rooms
-        grid_size = 1
-        for i in range(0, num_rooms):
-            x = room_graph[i][0][0]
-            grid_size = max(grid_size, room_graph[i][0][0], room_graph[i][0][1])
-            self.rooms[i] = Room(f"Room {i}", f"({room_graph[i][0][0]},{room_graph[i][0][1]})", i, room_graph[i][0][0],
-                                 room_graph[i][0][1])
-        self.room_grid = []
-        grid_size += 1
-        self.grid_size = grid_size
-        for i in range(0, grid_size):
-            self.room_grid.append([None] * grid_size)
-        for room_id in room_graph:
-            room = self.rooms[room_id]
-            self.room_grid[room.x][room.y] = room
-            if 'n' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('n', self.rooms[room_graph[room_id][1]['n']])
-            if 's' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('s', self.rooms[room_graph[room_id][1]['s']])
-            if 'e' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('e', self.rooms[room_graph[room_id][1]['e']])
-            if 'w' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('w', self.rooms[room_graph[room_id][1]['w']])
+        """Build the world from a {room_id: [(x, y), {direction: room_id}]} dictionary."""
+        self.load_rooms((room_id, coords[0], coords[1], exits) for room_id, (coords, exits) in room_graph.items())
+
+    def load_map(self, map_file, compact=False):
+        """Build the world straight from a map file (text or compile_map() JSON)."""
+        self.load_rooms(iter_rooms(map_file), compact)
+
+    def load_rooms(self, records, compact=False):
+        """
+        Build the world in a single pass over (room_id, x, y, exits) records.
+
+        With compact=True the rooms are stored in a RoomTable (struct-of-arrays)
+        instead of one Room object each; self.rooms[room_id] then returns a RoomView.
+        """
+        if compact:
+            self.rooms = RoomTable.from_records(records)
+        else:
+            self.rooms = self._build_rooms(records)
+        self._build_grid()
         self.starting_room = self.rooms[0]
 
-    def print_rooms(self):
-        rotated_room_grid = []
-        for i in range(0, len(self.room_grid)):
-            rotated_room_grid.append([None] * len(self.room_grid))
-        for i in range(len(self.room_grid)):
-            for j in range(len(self.room_grid[0])):
-                rotated_room_grid[len(self.room_grid[0]) - j - 1][i] = self.room_grid[i][j]
-        print("#####")
-        str = ""
-        for row in rotated_room_grid:
-            all_null = True
-            for room in row:
-                if room is not None:
-                    all_null = False
-                    break
-            if all_null:
-                continue
-            # PRINT NORTH CONNECTION ROW
-            str += "#"
-            for room in row:
-                if room is not None and room.n_to is not None:
-                    str += "  |  "
-                else:
-                    str += "     "
-            str += "#\n"
-            # PRINT ROOM ROW
-            str += "#"
-            for room in row:
-                if room is not None and room.w_to is not None:
-                    str += "-"
-                else:
-                    str += " "
-                if room is not None:
-                    str += f"{room.id}".zfill(3)
-                else:
-                    str += "   "
-                if room is not None and room.e_to is not None:
-                    str += "-"
-                else:
-                    str += " "
-            str += "#\n"
-            # PRINT SOUTH CONNECTION ROW
-            str += "#"
-            for room in row:
-                if room is not None and room.s_to is not None:
-                    str += "  |  "
-                else:
-                    str += "     "
-            str += "#\n"
-        print(str)
-        print("#####")
+    @staticmethod
+    def _build_rooms(records):
+        rooms = {}
+        for room_id, x, y, exits in records:
+            room = rooms.get(room_id)
+            if room is None:
+                room = rooms[room_id] = Room(None, None, room_id)
+            # name and description are formatted lazily by Room
+            room.x = x
+            room.y = y
+            for direction, target_id in exits.items():
+                # rooms we haven't read yet are created now and filled in when their record arrives
+                target = rooms.get(target_id)
+                if target is None:
+                    target = rooms[target_id] = Room(None, None, target_id)
+                setattr(room, EXIT_ATTRIBUTES[direction], target)
+                setattr(target, EXIT_ATTRIBUTES[OPPOSITE_DIRECTIONS[direction]], room)
+        # an exit to a room whose record never arrived leaves a placeholder with no coordinates
+        for room_id, room in rooms.items():
+            if room.x is None:
+                raise ValueError(f"room {room_id} is the target of an exit but has no entry in the map")
+        return rooms
+
+    def _build_grid(self):
+        self.room_index = SparseGrid.from_rooms(self.rooms)
+        self.grid_size = max(1, self.room_index.max_x, self.room_index.max_y) + 1
+
+    def print_rooms(self, center=None, radius=None):
+        """Print an ASCII map, optionally cropped to radius rooms around center=(x, y)."""
+        MapRenderer(self).render(sys.stdout, center, radius)
@@ -1,44 +1,80 @@
-from collections import deque
+import sys
+
+
+def read_pairs(lines):
+    """
+    Yield (parent, child) integer pairs from lines like "1 3" or "1,3".
+
+    Works on any iterable of lines -- an open file is read lazily, one line at a time.
+    Blank lines are skipped.
+    """
+    for line in lines:
+        fields = line.replace(",", " ").split()
+        if fields:
+            parent, child = fields
+            yield int(parent), int(child)
+
+
+def build_parents(ancestors):
+    """Consume an iterable of (parent, child) pairs into a child -> [parents] dictionary."""
+    parents = {}
+    for parent, child in ancestors:
+        if child in parents:
+            parents[child].append(parent)
+        else:
+            parents[child] = [parent]
+    return parents
+
 
 def earliest_ancestor(ancestors, starting_node):
-    # Build the graph
-    graph = {}
-
-    for pair in ancestors:
-        graph[]
-        graph.add_vertex(pair[1])
-        # Build edges in reverse
-        graph.add_edge(pair[1], pair[0])
-
-    # Do a BFS (storing the path)
-    q = deque()
-    q.enqueue([starting_node])
-    max_path_len = 1
-    early_ancestor = -1
-
-    while q:
-        path = q.dequeue()
-        v = path[-1]
-        # If the path is longer or equal and the value is smaller, or if the path is longer)
-        if (len(path) >= max_path_len and v < early_ancestor) or (len(path) > max_path_len):
-            early_ancestor = v
-            max_path_len = len(path)
-
-        for neighbor in graph.vertices[v]:
-            path_copy = list(path)
-            path_copy.append(neighbor)
-            q.enqueue(path_copy)
-
-    return early_ancestor
-
-# def earliest_ancestor(ancestor, starting_nodes):
-#     graph = {}
-#     for node, connection in ancestor:
-#
-#         if node in graph:
-#             graph[node].add(connection)
+    """
+    Return the ancestor farthest from starting_node (lowest ID on ties), or -1 if they have no parents.
+
+    ancestors may be any iterable of (parent, child) pairs, including a generator
+    such as read_pairs(open(path)); it is consumed once and never stored as a list.
+    Raises ValueError if someone turns out to be their own ancestor.
+    """
+    # Build the graph, edges pointing from child to parents
+    parents = build_parents(ancestors)
+
+    # Longest-path DP over the ancestry DAG: farthest[person] = (generations up, earliest ancestor).
+    # An iterative post-order DFS fills it in, so every person is expanded once -- O(V + E)
+    # even when the same ancestor is reachable through many lines of descent.
+    farthest = {}
+    in_progress = set()
+    stack = [(starting_node, False)]
+    while stack:
+        person, parents_done = stack.pop()
+        if person in farthest:
+            continue
+        if parents_done:
+            in_progress.discard(person)
+            best_depth, best_ancestor = 0, person
+            for parent in parents.get(person, ()):
+                depth, ancestor = farthest[parent]
+                depth += 1
+                # the farthest ancestor wins; ties go to the lowest ID
+                if depth > best_depth or (depth == best_depth and ancestor < best_ancestor):
+                    best_depth, best_ancestor = depth, ancestor
+            farthest[person] = (best_depth, best_ancestor)
+        else:
+            if person in in_progress:
+                raise ValueError(f"{person} is their own ancestor!")
+            in_progress.add(person)
+            stack.append((person, True))
+            for parent in parents.get(person, ()):
+                if parent not in farthest:
+                    stack.append((parent, False))
+
+    depth, ancestor = farthest[starting_node]
+    return ancestor if depth else -1
 
 
 if __name__ == '__main__':
-    test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
-    earliest_ancestor(test_ancestors)
+    if len(sys.argv) == 3:
+        # python ancestor.py pairs.txt 6
+        with open(sys.argv[1]) as pairs_file:
+            print(earliest_ancestor(read_pairs(pairs_file), int(sys.argv[2])))
+    else:
+        test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
+        print(earliest_ancestor(test_ancestors, 6))
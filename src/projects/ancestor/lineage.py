@@ -0,0 +1,174 @@
+"""
+Binary-lifting index over the parent relation for very deep genealogies.
+
+People can have several parents, so the index follows each person's *earliest
+lineage*: the parent on their longest line back, with the lowest earliest
+ancestor on ties. Walking those parents always ends at the person
+earliest_ancestor() returns, which makes these O(log n) queries:
+
+* depth(person)          -- generations back to their earliest ancestor
+* kth_ancestor(person, k) -- k generations up the earliest lineage
+* earliest_ancestor(person)
+* lowest_common_ancestor(a, b) -- on the earliest-lineage forest
+
+The tables are flat integer arrays (people sorted by ID, so lookups bisect
+instead of hashing). save() writes them to one file and load() can mmap it
+back without reading it into memory.
+"""
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+
+from ancestor import build_parents
+
+_HEADER = struct.Struct("<8sqq")  # magic, number of people, number of lifting levels
+_MAGIC = b"LINEAGE1"
+
+
+class LineageIndex:
+    def __init__(self, labels, depths, jumps, levels):
+        self.labels = labels  # person IDs in ascending order; a person's index is their position here
+        self.depths = depths  # index -> generations back to their earliest ancestor
+        # jumps[level * n + i] is the index 2**level generations above i (earliest ancestors point at themselves)
+        self.jumps = jumps
+        self.levels = levels
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, person):
+        return self._find(person) is not None
+
+    @classmethod
+    def from_pairs(cls, ancestors):
+        """Build the index from any iterable of (parent, child) pairs."""
+        parents = build_parents(ancestors)
+        people = set(parents)
+        for person_parents in parents.values():
+            people.update(person_parents)
+        labels = array("q", sorted(people))
+        n = len(labels)
+        if n >= 2 ** 31:
+            raise ValueError("too many people for 32-bit lineage tables")
+        index = {person: i for i, person in enumerate(labels)}
+
+        parent_ids = [[index[parent] for parent in parents.get(person, ())] for person in labels]
+        children = [[] for _ in range(n)]
+        waiting = array("i", [0]) * n  # parents not yet placed, per person
+        for i, person_parents in enumerate(parent_ids):
+            waiting[i] = len(person_parents)
+            for parent in person_parents:
+                children[parent].append(i)
+
+        # Place everyone in topological order (Kahn's algorithm), earliest ancestors first
+        depths = array("i", [0]) * n
+        primary = array("i", range(n))
+        earliest = list(labels)
+        ready = [i for i in range(n) if waiting[i] == 0]
+        placed = 0
+        while ready:
+            i = ready.pop()
+            placed += 1
+            for parent in parent_ids[i]:
+                # the farthest ancestor wins; ties go to the lowest ID
+                if (primary[i] == i or depths[parent] + 1 > depths[i]
+                        or (depths[parent] + 1 == depths[i] and earliest[parent] < earliest[i])):
+                    depths[i] = depths[parent] + 1
+                    earliest[i] = earliest[parent]
+                    primary[i] = parent
+            for child in children[i]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    ready.append(child)
+        if placed != n:
+            raise ValueError("the parent relation contains a cycle")
+
+        levels = max(1, max(depths, default=0).bit_length())
+        jumps = array("i", primary)
+        for level in range(1, levels):
+            below = (level - 1) * n
+            jumps.extend([jumps[below + jumps[below + i]] for i in range(n)])
+        return cls(labels, depths, jumps, levels)
+
+    def depth(self, person):
+        """Return how many generations separate person from their earliest ancestor."""
+        return self.depths[self._index_of(person)]
+
+    def kth_ancestor(self, person, k):
+        """Return the ancestor k generations up person's earliest lineage, or -1 if it is shorter than k."""
+        i = self._index_of(person)
+        if k < 0 or k > self.depths[i]:
+            return -1
+        return self.labels[self._lift(i, k)]
+
+    def earliest_ancestor(self, person):
+        """Return person's earliest ancestor, or -1 if they have no parents."""
+        if person not in self:
+            return -1
+        depth = self.depth(person)
+        return self.kth_ancestor(person, depth) if depth > 0 else -1
+
+    def lowest_common_ancestor(self, person1, person2):
+        """Return the deepest shared member of both earliest lineages, or -1 if they share none."""
+        i, j = self._index_of(person1), self._index_of(person2)
+        # bring both up to the same depth, then lift them together until they meet
+        if self.depths[i] < self.depths[j]:
+            i, j = j, i
+        i = self._lift(i, self.depths[i] - self.depths[j])
+        if i == j:
+            return self.labels[i]
+        n = len(self.labels)
+        for level in reversed(range(self.levels)):
+            up_i, up_j = self.jumps[level * n + i], self.jumps[level * n + j]
+            if up_i != up_j:
+                i, j = up_i, up_j
+        i, j = self.jumps[i], self.jumps[j]
+        return self.labels[i] if i == j else -1
+
+    def save(self, path):
+        """Write the tables to path in native byte order."""
+        with open(path, "wb") as index_file:
+            index_file.write(_HEADER.pack(_MAGIC, len(self.labels), self.levels))
+            for table in (self.labels, self.depths, self.jumps):
+                index_file.write(memoryview(table).cast("B"))
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """Load tables written by save(); with use_mmap they are paged in from the file on demand."""
+        with open(path, "rb") as index_file:
+            if use_mmap:
+                data = memoryview(mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(index_file.read())
+        magic, n, levels = _HEADER.unpack(data[:_HEADER.size])
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a saved LineageIndex")
+        start = _HEADER.size
+        labels = data[start:start + 8 * n].cast("q")
+        start += 8 * n
+        depths = data[start:start + 4 * n].cast("i")
+        start += 4 * n
+        jumps = data[start:start + 4 * n * levels].cast("i")
+        return cls(labels, depths, jumps, levels)
+
+    def _lift(self, i, k):
+        n = len(self.labels)
+        level = 0
+        while k:
+            if k & 1:
+                i = self.jumps[level * n + i]
+            k >>= 1
+            level += 1
+        return i
+
+    def _find(self, person):
+        i = bisect_left(self.labels, person)
+        if i < len(self.labels) and self.labels[i] == person:
+            return i
+
+    def _index_of(self, person):
+        i = self._find(person)
+        if i is None:
+            raise KeyError(f"{person} is not in this lineage index!")
+        return i
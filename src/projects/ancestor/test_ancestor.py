@@ -1,5 +1,6 @@
+import io
 import unittest
-from ancestor import earliest_ancestor
+from ancestor import earliest_ancestor, read_pairs
 
 
 '''
@@ -27,6 +28,27 @@ class Test(unittest.TestCase):
         self.assertEqual(earliest_ancestor(test_ancestors, 10), -1)
         self.assertEqual(earliest_ancestor(test_ancestors, 11), -1)
 
+    def test_earliest_ancestor_streaming(self):
+        pairs_file = io.StringIO("1 3\n2 3\n3 6\n5 6\n5 7\n\n4 5\n4 8\n8 9\n11,8\n10 1\n")
+        self.assertEqual(earliest_ancestor(read_pairs(pairs_file), 6), 10)
+        chain = ((person + 1, person) for person in range(100000))
+        self.assertEqual(earliest_ancestor(chain, 0), 100000)
+
+    def test_earliest_ancestor_ladder(self):
+        # person k has parents k + 1 and k + 2, so most people are reachable at many depths
+        people = 20000
+        ladder = [(person + step, person) for person in range(people) for step in (1, 2) if person + step <= people]
+        self.assertEqual(earliest_ancestor(ladder, 0), people)
+        self.assertEqual(earliest_ancestor(ladder, people - 1), people)
+
+    def test_earliest_ancestor_cycle(self):
+        with self.assertRaises(ValueError):
+            earliest_ancestor([(1, 2), (2, 3), (3, 1)], 1)
+        with self.assertRaises(ValueError):
+            earliest_ancestor([(4, 1), (1, 2), (2, 3), (3, 2)], 2)
+        # a cycle that isn't above starting_node doesn't matter
+        self.assertEqual(earliest_ancestor([(4, 1), (1, 2), (2, 3), (3, 2)], 1), 4)
+
 
 if __name__ == '__main__':
     unittest.main()
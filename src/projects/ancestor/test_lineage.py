@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from ancestor import earliest_ancestor
+from lineage import LineageIndex
+
+'''
+   10
+ /
+1   2   4  11
+ \\ /   / \\ /
+  3   5   8
+   \\ / \\   \\
+    6   7   9
+'''
+test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
+
+
+class LineageIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = LineageIndex.from_pairs(test_ancestors)
+
+    def test_earliest_ancestor(self):
+        for person in range(1, 12):
+            self.assertEqual(self.index.earliest_ancestor(person), earliest_ancestor(test_ancestors, person))
+        self.assertEqual(self.index.earliest_ancestor(12), -1)
+
+    def test_depth_and_kth_ancestor(self):
+        self.assertEqual(self.index.depth(6), 3)
+        self.assertEqual(self.index.kth_ancestor(6, 0), 6)
+        self.assertEqual(self.index.kth_ancestor(6, 1), 3)
+        self.assertEqual(self.index.kth_ancestor(6, 3), 10)
+        self.assertEqual(self.index.kth_ancestor(6, 4), -1)
+
+    def test_lowest_common_ancestor(self):
+        self.assertEqual(self.index.lowest_common_ancestor(7, 9), 4)
+        self.assertEqual(self.index.lowest_common_ancestor(6, 3), 3)
+        self.assertEqual(self.index.lowest_common_ancestor(6, 7), -1)  # 6's earliest lineage runs through 3
+
+    def test_deep_chain(self):
+        chain = LineageIndex.from_pairs((person + 1, person) for person in range(100000))
+        self.assertEqual(chain.earliest_ancestor(0), 100000)
+        self.assertEqual(chain.kth_ancestor(10, 65536), 65546)
+        self.assertEqual(chain.lowest_common_ancestor(5, 99999), 99999)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lineage.idx")
+            self.index.save(path)
+            for use_mmap in (True, False):
+                loaded = LineageIndex.load(path, use_mmap=use_mmap)
+                self.assertEqual(len(loaded), 11)
+                self.assertEqual(loaded.earliest_ancestor(9), 4)
+                self.assertEqual(loaded.lowest_common_ancestor(7, 9), 4)
+                del loaded
+
+    def test_cycle(self):
+        with self.assertRaises(ValueError):
+            LineageIndex.from_pairs([(1, 2), (2, 3), (3, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
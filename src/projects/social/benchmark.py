@@ -0,0 +1,38 @@
+"""
+Compare the top-down and direction-optimizing (hybrid) BFS engines.
+
+    python benchmark.py [num_users] [avg_friendships] [seed]
+
+Builds a random network with SocialGraph.populate_graph and runs a full
+BFS from user 1 with each engine, reporting edge checks and wall time.
+"""
+import sys
+import time
+
+from engines import ENGINES
+from social import SocialGraph
+
+
+def benchmark(num_users=100000, avg_friendships=20, seed=1):
+    social_graph = SocialGraph()
+    social_graph.populate_graph(num_users, avg_friendships, seed=seed)
+    print(f"{num_users} users, {num_users * avg_friendships // 2} friendships (seed={seed})")
+
+    results = {}
+    for name, engine in ENGINES.items():
+        stats = {}
+        start = time.perf_counter()
+        parents = engine(social_graph.friendships, 1, stats=stats)
+        elapsed = time.perf_counter() - start
+        results[name] = stats
+        print(f"{name:>9}: {stats['edge_checks']:>12,} edge checks, "
+              f"{stats['levels']} levels ({stats['bottom_up_levels']} bottom-up), "
+              f"{len(parents):,} users reached in {elapsed:.3f}s")
+
+    reduction = 1 - results["hybrid"]["edge_checks"] / results["top_down"]["edge_checks"]
+    print(f"hybrid skipped {reduction:.1%} of the top-down edge checks")
+    return results
+
+
+if __name__ == '__main__':
+    benchmark(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,81 @@
+import sys
+from collections import OrderedDict
+
+
+class BFSTreeCache:
+    """
+    Bounded LRU cache of BFS parent trees, keyed by starting user.
+
+    Every entry remembers the graph version it was built against. A lookup made
+    with a different version drops the entry and counts as a miss, so a tree is
+    never served after the graph has changed. Entries are evicted
+    least-recently-used first once there are more than max_entries of them or
+    their estimated size (see tree_size) exceeds max_bytes (None for no byte budget).
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # user_id -> (version, parents, size in bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, user_id, version):
+        """Return the cached parents dict for user_id, or None if it is missing or stale."""
+        entry = self.entries.get(user_id)
+        if entry is None or entry[0] != version:
+            if entry is not None:
+                self._remove(user_id)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, user_id, version, parents):
+        """Cache the parents dict for user_id, built against the given graph version."""
+        if user_id in self.entries:
+            self._remove(user_id)
+        size = tree_size(parents)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self.entries[user_id] = (version, parents, size)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters along with the current size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+    def _remove(self, user_id):
+        _, _, size = self.entries.pop(user_id)
+        self.bytes -= size
+
+
+def tree_size(parents):
+    """
+    Estimate the bytes held by a BFS parents dict: its hash table plus the int objects in it.
+
+    sys.getsizeof of a dict only counts the table. Every parent is itself a key
+    (or None), so adding up the keys counts each int the tree holds once.
+    """
+    return sys.getsizeof(parents) + sum(map(sys.getsizeof, parents))
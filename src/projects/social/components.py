@@ -0,0 +1,78 @@
+from array import array
+from collections import Counter
+
+ABSENT = -1
+
+
+class DisjointSet:
+    """
+    Union-find over non-negative integer IDs, with path compression and union by rank.
+
+    IDs index straight into flat arrays (IDs that were never added are ABSENT),
+    so find and union run in near-constant amortized time. The number of
+    components of each size is kept in a Counter that every union updates,
+    so the whole size histogram is always current.
+    """
+
+    def __init__(self):
+        self.parents = array("q")
+        self.ranks = bytearray()  # a rank never exceeds log2(number of IDs)
+        self.sizes = array("q")  # only meaningful at component roots
+        self.histogram = Counter()  # component size -> number of components that size
+        self.count = 0  # number of components
+
+    def add(self, item):
+        """Add item as a component of its own (a no-op if it is already present)."""
+        missing = item + 1 - len(self.parents)
+        if missing > 0:
+            self.parents.extend(array("q", [ABSENT]) * missing)
+            self.ranks.extend(bytes(missing))
+            self.sizes.extend(array("q", [0]) * missing)
+        if self.parents[item] == ABSENT:
+            self.parents[item] = item
+            self.sizes[item] = 1
+            self.histogram[1] += 1
+            self.count += 1
+
+    def __contains__(self, item):
+        return 0 <= item < len(self.parents) and self.parents[item] != ABSENT
+
+    def find(self, item):
+        """Return the root ID of item's component."""
+        if item not in self:
+            raise KeyError(item)
+        parents = self.parents
+        root = item
+        while parents[root] != root:
+            root = parents[root]
+        # path compression: point everything we passed straight at the root
+        while parents[item] != root:
+            parents[item], item = root, parents[item]
+        return root
+
+    def union(self, a, b):
+        """Merge the components of a and b; return False if they were already one component."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        # union by rank: hang the shallower tree under the deeper one
+        if self.ranks[root_a] < self.ranks[root_b]:
+            root_a, root_b = root_b, root_a
+        elif self.ranks[root_a] == self.ranks[root_b]:
+            self.ranks[root_a] += 1
+        self.parents[root_b] = root_a
+
+        histogram = self.histogram
+        size_a, size_b = self.sizes[root_a], self.sizes[root_b]
+        for size in (size_a, size_b):
+            histogram[size] -= 1
+            if not histogram[size]:
+                del histogram[size]
+        histogram[size_a + size_b] += 1
+        self.sizes[root_a] = size_a + size_b
+        self.count -= 1
+        return True
+
+    def size(self, item):
+        """Return the number of IDs in item's component."""
+        return self.sizes[self.find(item)]
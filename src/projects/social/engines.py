@@ -0,0 +1,118 @@
+"""
+BFS engines over a friendships dictionary (user ID -> set of friend IDs).
+
+Every engine returns a parents dictionary mapping each reached user to the
+friend it was reached through (None for the source). SocialGraph picks one
+with its `engine` argument.
+
+* top_down -- the classic BFS: every frontier user checks all of its friends.
+* hybrid   -- direction-optimizing BFS. While the frontier is small it runs
+              top-down. Once the frontier's edges outnumber the unvisited
+              users' edges by ALPHA, it switches to bottom-up: every unvisited
+              user looks for *one* friend in the frontier and stops at the
+              first hit. On low-diameter social graphs the middle levels
+              cover most users, so this skips most checks against users that
+              are already visited.
+
+Pass a dict as `stats` to collect "edge_checks", "levels" and
+"bottom_up_levels" counters.
+"""
+
+# Beamer et al.'s tuning constants: go bottom-up when frontier edges > unvisited edges / ALPHA,
+# come back top-down when the frontier shrinks below num_users / BETA
+ALPHA = 14
+BETA = 24
+
+
+def top_down_bfs(friendships, source, destination=None, stats=None):
+    """Level-by-level top-down BFS from source; stops early once destination is reached."""
+    parents = {source: None}
+    frontier = [source]
+    edge_checks = 0
+    levels = 0
+    while frontier and destination not in parents:
+        levels += 1
+        next_frontier = []
+        for friend in frontier:
+            for next_friend in friendships[friend]:
+                edge_checks += 1
+                if next_friend not in parents:
+                    parents[next_friend] = friend
+                    next_frontier.append(next_friend)
+        frontier = next_frontier
+    _record(stats, edge_checks, levels, 0)
+    return parents
+
+
+def hybrid_bfs(friendships, source, destination=None, stats=None):
+    """Direction-optimizing BFS from source; stops early once destination is reached."""
+    parents = {source: None}
+    frontier = [source]
+    num_users = len(friendships)
+    # edges still hanging off unvisited users; only an estimate once bottom-up starts
+    unvisited_edges = sum(len(friends) for friends in friendships.values()) - len(friendships[source])
+    unvisited = None  # list of unvisited users, only built once we first go bottom-up
+    bottom_up = False
+    edge_checks = 0
+    levels = 0
+    bottom_up_levels = 0
+    while frontier and destination not in parents:
+        levels += 1
+        if bottom_up:
+            bottom_up = len(frontier) >= num_users / BETA
+        else:
+            frontier_edges = sum(len(friendships[friend]) for friend in frontier)
+            bottom_up = frontier_edges > unvisited_edges / ALPHA
+
+        next_frontier = []
+        if bottom_up:
+            bottom_up_levels += 1
+            if unvisited is None:
+                unvisited = [user for user in friendships if user not in parents]
+            else:
+                unvisited = [user for user in unvisited if user not in parents]
+            in_frontier = set(frontier)
+            still_unvisited = []
+            for user in unvisited:
+                for friend in friendships[user]:
+                    edge_checks += 1
+                    if friend in in_frontier:
+                        parents[user] = friend
+                        next_frontier.append(user)
+                        break
+                else:
+                    still_unvisited.append(user)
+            unvisited = still_unvisited
+        else:
+            for friend in frontier:
+                for next_friend in friendships[friend]:
+                    edge_checks += 1
+                    if next_friend not in parents:
+                        parents[next_friend] = friend
+                        next_frontier.append(next_friend)
+
+        unvisited_edges -= sum(len(friendships[user]) for user in next_frontier)
+        frontier = next_frontier
+    _record(stats, edge_checks, levels, bottom_up_levels)
+    return parents
+
+
+ENGINES = {
+    "top_down": top_down_bfs,
+    "hybrid": hybrid_bfs,
+}
+
+
+def get_engine(name):
+    """Look up a BFS engine by name."""
+    if name in ENGINES:
+        return ENGINES[name]
+    else:
+        raise ValueError(f"{name} is not a BFS engine! Choose one of {sorted(ENGINES)}")
+
+
+def _record(stats, edge_checks, levels, bottom_up_levels):
+    if stats is not None:
+        stats["edge_checks"] = stats.get("edge_checks", 0) + edge_checks
+        stats["levels"] = stats.get("levels", 0) + levels
+        stats["bottom_up_levels"] = stats.get("bottom_up_levels", 0) + bottom_up_levels
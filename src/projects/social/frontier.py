@@ -0,0 +1,86 @@
+"""
+Level-synchronous breadth-first search over a CSR adjacency.
+
+Instead of popping one vertex at a time, every level expands the whole
+frontier at once: gather the neighbors of all frontier vertices, mask out
+the ones already visited, and scatter the new distances and parents.
+With NumPy installed each level is a handful of array operations; without
+it the same level-by-level loop runs over stdlib arrays.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional -- fall back to the pure Python levels below
+    np = None
+
+UNREACHED = -1
+
+
+def frontier_bfs(offsets, targets, source):
+    """
+    Return (distances, parents) for every vertex index reachable from source.
+
+    offsets and targets describe the graph in CSR form: the neighbors of
+    vertex i are targets[offsets[i]:offsets[i + 1]]. Both results hold one
+    entry per vertex, with UNREACHED for vertices that source cannot reach.
+    The parent of source is UNREACHED too. They are NumPy arrays when NumPy
+    is available and stdlib arrays otherwise.
+    """
+    num_vertices = len(offsets) - 1
+    if not 0 <= source < num_vertices:
+        raise IndexError(f"{source} is not a vertex index in this graph!")
+    if np is not None:
+        return _frontier_bfs_numpy(offsets, targets, source, num_vertices)
+    return _frontier_bfs_python(offsets, targets, source, num_vertices)
+
+
+def _frontier_bfs_numpy(offsets, targets, source, num_vertices):
+    offsets = np.asarray(offsets, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    distances = np.full(num_vertices, UNREACHED, dtype=np.int64)
+    parents = np.full(num_vertices, UNREACHED, dtype=np.int64)
+    distances[source] = 0
+
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        # gather: position k of the flattened neighbor list belongs to frontier vertex owners[k]
+        owners = np.repeat(frontier, counts)
+        firsts = np.cumsum(counts) - counts  # where each frontier vertex starts in the flat list
+        edge_ids = np.arange(total, dtype=np.int64) + np.repeat(starts - firsts, counts)
+        neighbors = targets[edge_ids]
+        # mask: keep neighbors not yet visited, one entry (and so one parent) per neighbor
+        unvisited = distances[neighbors] == UNREACHED
+        neighbors, first_seen = np.unique(neighbors[unvisited], return_index=True)
+        # scatter
+        level += 1
+        distances[neighbors] = level
+        parents[neighbors] = owners[unvisited][first_seen]
+        frontier = neighbors
+    return distances, parents
+
+
+def _frontier_bfs_python(offsets, targets, source, num_vertices):
+    distances = array("q", [UNREACHED]) * num_vertices
+    parents = array("q", [UNREACHED]) * num_vertices
+    distances[source] = 0
+
+    frontier = [source]
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = []
+        for vert in frontier:
+            for next_vert in targets[offsets[vert]:offsets[vert + 1]]:
+                if distances[next_vert] == UNREACHED:
+                    distances[next_vert] = level
+                    parents[next_vert] = vert
+                    next_frontier.append(next_vert)
+        frontier = next_frontier
+    return distances, parents
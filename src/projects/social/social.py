@@ -1,5 +1,12 @@
+import os
 import random
-from collections import deque
+from array import array
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from components import DisjointSet
+from engines import get_engine
+from frontier import frontier_bfs
 
 
 class User:
@@ -10,11 +17,50 @@ class User:
         return f"User({self.name})"
 
 
+class SocialPaths(Mapping):
+    """
+    Read-only mapping of friend ID -> shortest friendship path from a single user.
+
+    Only the BFS parent pointers are stored. A friend's path list is rebuilt
+    by walking those pointers back to the starting user when the key is read.
+    """
+
+    def __init__(self, parents):
+        self.parents = parents  # friend ID -> the friend we reached them through (None for the start)
+
+    def __getitem__(self, friend_id):
+        parents = self.parents
+        if friend_id not in parents:
+            raise KeyError(friend_id)
+        path = []
+        while friend_id is not None:
+            path.append(friend_id)
+            friend_id = parents[friend_id]
+        path.reverse()
+        return path
+
+    def __iter__(self):
+        return iter(self.parents)
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __contains__(self, friend_id):
+        return friend_id in self.parents
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class SocialGraph:
-    def __init__(self):
+    def __init__(self, tree_cache=None):
         self.last_id = 0
         self.users = {}
         self.friendships = {}
+        self.version = 0  # bumped on every change so cached BFS trees and CSR arrays go stale
+        self.tree_cache = tree_cache  # optional cache.BFSTreeCache shared by the path queries
+        self._csr = None  # (version, offsets, targets) built by to_csr
+        self.components = DisjointSet()  # extended networks, kept current by every friendship
 
     def add_friendship(self, user_id, friend_id):
         """
@@ -28,6 +74,8 @@ class SocialGraph:
         else:
             self.friendships[user_id].add(friend_id)
             self.friendships[friend_id].add(user_id)
+            self.components.union(user_id, friend_id)
+            self.version += 1
 
     def add_user(self, name):
         """
@@ -37,12 +85,14 @@ class SocialGraph:
         self.last_id += 1  # automatically increment the ID to assign the new user
         self.users[self.last_id] = User(name)
         self.friendships[self.last_id] = set()
+        self.components.add(self.last_id)
+        self.version += 1
 
     def add_friendships(self, user_id, *friends):
         for friend in friends:
             self.add_friendship(user_id, friend)
 
-    def populate_graph(self, num_users, avg_friendships):
+    def populate_graph(self, num_users, avg_friendships, seed=None):
         """
         Takes a number of users and an average number of friendships
         as arguments
@@ -51,106 +101,185 @@ class SocialGraph:
         between those users.
 
         The number of users must be greater than the average number of friendships.
+
+        Friendships are drawn by rejection sampling: pick two random users and
+        keep the pair unless it is a self-friendship or a duplicate. That runs in
+        O(num_users + num_friendships) expected time and memory instead of
+        building and shuffling all n * (n - 1) / 2 candidate pairs.
+        Pass `seed` to get the same network back on every run.
         """
 
+        # divide by two to avoid duplicates
+        target_friendships = (num_users * avg_friendships) // 2
+        if target_friendships > num_users * (num_users - 1) // 2:
+            raise ValueError(f"{num_users} users cannot have {avg_friendships} friends each on average")
+
         # Reset graph
         self.last_id = 0
         self.users = {}
         self.friendships = {}
+        self.components = DisjointSet()
+        self.version += 1
 
         # Add users
         for i in range(num_users):
             # generates "test_user1", "test_user2", "test_user3"
             self.add_user(f"test_user{i}")
 
-        # Create friendships
-        potential_friendships = []
-        for user_id in self.users:
-            # start with friend after user_id, end with last_id
-            for friend_id in range(user_id + 1, self.last_id + 1):
-                potential_friendships.append((user_id, friend_id))
+        rng = random.Random(seed)
+        created = 0
+        while created < target_friendships:
+            user_id = rng.randint(1, self.last_id)
+            friend_id = rng.randint(1, self.last_id)
+            # rejected samples are simply redrawn -- no warnings, no bookkeeping
+            if user_id == friend_id or friend_id in self.friendships[user_id]:
+                continue
+            self.friendships[user_id].add(friend_id)
+            self.friendships[friend_id].add(user_id)
+            self.components.union(user_id, friend_id)
+            created += 1
+        self.version += 1
 
-        # shuffle up friendships!
-        random.shuffle(potential_friendships)
+    def get_shortest_path(self, starting_user, destination_user, engine="top_down"):
+        """
+        Return the shortest friend path from starting user to destination user
 
-        # divide by two to avoid duplicates
-        for i in range((num_users * avg_friendships) // 2):
-            friendship = potential_friendships[i]
-            self.add_friendship(friendship[0], friendship[1])
-
-    def get_shortest_path(self, starting_user, destination_user):
-        """Return the shortest friend path from starting user to destination user"""
-
-        # using collections.deque as a Queue (cuz that's better than writing a class!)
-        # deque.append(value) will add the value at the end of the list
-        # deque.popleft() will return the value at the beginning of the list
-        q = deque()
-
-        # add path with just our starting user to the end of our queue
-        # our queue will hold a collection of possible paths from starting_user to somewhere
-        # (hopefully destination_user)
-        q.append([starting_user])
-
-        # visited will be a set with all visited nodes (or "vertices" or "users")
-        visited = set()
-
-        # while our queue is not empty
-        while len(q) > 0:
-            path = q.popleft()  # get the least-recently added path
-            friend = path[-1]  # the last vertex in our path
-            # if friend has not yet been visited
-            if friend not in visited:
-                # if friend is our destination, our path is complete!
-                if friend == destination_user:
-                    # so return it
-                    return path
-
-                # if we're here then friend is not our destination_user
-                visited.add(friend)
-
-                # add all next possible paths to our queue
-                for next_friend in self.friendships[friend]:
-                    new_path = path.copy()  # make a copy of our path
-                    new_path.append(next_friend)  # add next friend to our copied path
-                    q.append(new_path)  # add this possible path to our queue so we can re-iterate!
-
-    def get_all_social_paths(self, user_id):
+        engine picks the BFS strategy from engines.ENGINES ("top_down" or "hybrid").
+        Returns None when destination_user is not in starting_user's extended network.
+        """
+
+        if self.tree_cache is not None:
+            # build (or reuse) the whole tree so later queries from starting_user are free
+            parents = self._bfs_tree(starting_user, engine)
+        else:
+            # the BFS stops as soon as destination_user gets a parent pointer
+            parents = get_engine(engine)(self.friendships, starting_user, destination_user)
+        if destination_user in parents:
+            return SocialPaths(parents)[destination_user]
+
+    def get_all_social_paths(self, user_id, engine="top_down"):
         """
         Find the shortest path to each friend in user_id's extended network
 
         Return a dictionary containing every user in that user's extended network with
         the shortest friendship path between them.
         The key is the friend's ID and the value is the path.
+
+        A single BFS records one parent pointer per friend, so this is O(V + E).
+        The returned SocialPaths mapping builds each path only when it is read.
+        engine picks the BFS strategy from engines.ENGINES ("top_down" or "hybrid").
         """
 
-        # this solution is a BFS within a DFS.
-        # DFS through every friend, friend of a friend, friend of a friend of a friend, etc.
-        # to obtain the full extended network. that's how we get our KEYS
-        #
-        # use a deque as stack. append adds to end, pop takes from end. FIFO
-        stack = deque()
-        # start with one path that only contains our user_id.
-        # the stack will contain a collection of paths from user_id to somewhere
-        stack.append([user_id])
-        friend_paths = {}  # friend_paths dict (visited dict)
-        while len(stack) > 0:  # while stack is not empty
-            path = stack.pop()  # get the MOST RECENTLY ADDED path
-            friend = path[-1]  # take the last friend from path
-
-            # if friend not yet visited
-            if friend not in friend_paths:
-                # then make friend a key in our dict, with a value that is the shortest path from
-                # given user TO this friend
-                # self.get_shortest_path will use a BFS to find the shortest path from user_id to friend
-                friend_paths[friend] = self.get_shortest_path(user_id, friend)
-
-                # for every possible next friend in path
-                for next_friend in self.friendships[friend]:
-                    new_path = path.copy()  # make a copy of our path
-                    new_path.append(next_friend)  # add our next friend to that path
-                    stack.append(new_path)  # add this next possible path to our stack
-
-        return friend_paths  # return our visited friends with each shortest path
+        # one BFS over the whole extended network: friend -> the friend we found them through
+        return SocialPaths(self._bfs_tree(user_id, engine))
+
+    def _bfs_tree(self, user_id, engine):
+        """Return the BFS parents dict for user_id, going through tree_cache when there is one."""
+        if self.tree_cache is None:
+            return get_engine(engine)(self.friendships, user_id)
+        parents = self.tree_cache.get(user_id, self.version)
+        if parents is None:
+            parents = get_engine(engine)(self.friendships, user_id)
+            self.tree_cache.put(user_id, self.version, parents)
+        return parents
+
+    def get_shortest_paths(self, pairs, engine="top_down", workers=None):
+        """
+        Answer many shortest-path queries at once.
+
+        pairs is a list of (starting_user, destination_user) tuples. Queries are grouped
+        by starting user so each group shares one BFS tree, and the groups run across a
+        pool of `workers` processes (default: one per CPU; 1 runs everything in this
+        process). Returns one path (or None) per pair, in the same order as pairs.
+        """
+        groups = {}  # starting_user -> [(position in pairs, destination_user), ...]
+        for position, (starting_user, destination_user) in enumerate(pairs):
+            groups.setdefault(starting_user, []).append((position, destination_user))
+
+        tasks = [(starting_user, [dest for _, dest in queries]) for starting_user, queries in groups.items()]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            bfs = get_engine(engine)
+            group_paths = [_group_paths(self.friendships, bfs, *task) for task in tasks]
+        else:
+            # the friendships are shipped to each worker once, not once per group
+            with ProcessPoolExecutor(workers, initializer=_init_path_worker,
+                                     initargs=(self.friendships, engine)) as pool:
+                group_paths = list(pool.map(_paths_from, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+        results = [None] * len(pairs)
+        for queries, paths in zip(groups.values(), group_paths):
+            for (position, _), path in zip(queries, paths):
+                results[position] = path
+        return results
+
+    def to_csr(self):
+        """
+        Return the friendships as compressed sparse rows (offsets, targets).
+
+        User IDs are used directly as indices, so the friends of user_id are
+        targets[offsets[user_id]:offsets[user_id + 1]] (index 0 is an empty row).
+        The arrays are cached until the graph version changes.
+        """
+        if self._csr is None or self._csr[0] != self.version:
+            offsets = array("q", [0])
+            targets = array("i" if self.last_id < 2 ** 31 else "q")
+            for user_id in range(self.last_id + 1):
+                targets.extend(self.friendships.get(user_id, ()))
+                offsets.append(len(targets))
+            self._csr = (self.version, offsets, targets)
+        return self._csr[1:]
+
+    def get_component_id(self, user_id):
+        """
+        Return an ID for user_id's extended network (connected component).
+
+        Two users are in each other's extended network exactly when their component
+        IDs are equal. IDs are stable until the next friendship merges two networks.
+        """
+        return self.components.find(user_id)
+
+    def get_component_size(self, user_id):
+        """Return how many users are in user_id's extended network, user_id included."""
+        return self.components.size(user_id)
+
+    def get_component_sizes(self):
+        """Return a Counter of extended network size -> how many networks have that size."""
+        return self.components.histogram.copy()
+
+    def get_social_distances(self, user_id):
+        """
+        Return (distances, parents) arrays indexed by user ID, from one level-synchronous BFS.
+
+        distances[friend_id] is the degree of separation from user_id and parents[friend_id]
+        is the friend it was reached through. Users outside user_id's extended network
+        hold frontier.UNREACHED in both arrays, as does the parent of user_id itself.
+        """
+        offsets, targets = self.to_csr()
+        return frontier_bfs(offsets, targets, user_id)
+
+
+# per-process state for SocialGraph.get_shortest_paths
+_worker_friendships = None
+_worker_engine = None
+
+
+def _init_path_worker(friendships, engine):
+    global _worker_friendships, _worker_engine
+    _worker_friendships = friendships
+    _worker_engine = get_engine(engine)
+
+
+def _paths_from(task):
+    return _group_paths(_worker_friendships, _worker_engine, *task)
+
+
+def _group_paths(friendships, bfs, starting_user, destinations):
+    """Return the shortest path from one starting user to each of its destinations."""
+    # a lone destination can stop the BFS early; otherwise build the whole tree once
+    target = destinations[0] if len(destinations) == 1 else None
+    paths = SocialPaths(bfs(friendships, starting_user, target))
+    return [paths[dest] if dest in paths else None for dest in destinations]
 
 
 graph_01 = {
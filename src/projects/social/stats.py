@@ -0,0 +1,165 @@
+"""
+Network statistics for a SocialGraph: degrees of separation, diameter and reach.
+
+Every number comes from one BFS per source user (frontier.frontier_bfs over
+SocialGraph.to_csr()), reduced on the spot to a SourceStats summary:
+
+    reach        share of the other users in the source's extended network
+    separation   mean degree of separation from the source to that network
+    eccentricity largest degree of separation from the source
+
+network_stats() runs those BFSs across a process pool and averages them.
+With samples=None it visits every user, which is exact and fine for mid-size
+graphs. With samples=k it visits k users drawn without replacement and
+reports normal-approximation confidence intervals for the averages, which
+is how to get answers for 10^6+ users. Either way a progress callback sees
+the running estimate after every source.
+"""
+import math
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from frontier import frontier_bfs
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional -- the BFS results are plain arrays without it
+    np = None
+
+SourceStats = namedtuple("SourceStats", "user_id reached total_separation eccentricity")
+
+# averages are over source users; separation skips users with no friends at all.
+# The intervals are (low, high) and collapse to a single point when every user was visited.
+# diameter is the largest eccentricity seen, so it is a lower bound unless exact.
+NetworkStats = namedtuple(
+    "NetworkStats",
+    "sources average_separation separation_interval reach_percentage reach_interval diameter exact",
+)
+
+
+def source_stats(offsets, targets, user_id):
+    """Return the SourceStats of one BFS from user_id over a CSR adjacency."""
+    distances, _ = frontier_bfs(offsets, targets, user_id)
+    if np is not None and isinstance(distances, np.ndarray):
+        found = distances[distances > 0]
+        return SourceStats(user_id, int(found.size), int(found.sum()), int(found.max(initial=0)))
+    reached = total = eccentricity = 0
+    for distance in distances:
+        if distance > 0:
+            reached += 1
+            total += distance
+            if distance > eccentricity:
+                eccentricity = distance
+    return SourceStats(user_id, reached, total, eccentricity)
+
+
+def network_stats(social_graph, samples=None, workers=None, confidence=0.95, seed=None, progress=None):
+    """
+    Return NetworkStats for social_graph.
+
+    samples=None visits every user; an integer visits that many users chosen at random
+    (reproducibly with seed). The BFSs run on `workers` processes (default: one per CPU;
+    1 runs everything in this process). progress, if given, is called as
+    progress(done, total, NetworkStats so far) after each source.
+    """
+    user_ids = list(social_graph.users)
+    num_users = len(user_ids)
+    if samples is not None and samples < num_users:
+        user_ids = random.Random(seed).sample(user_ids, samples)
+    summary = _Summary(num_users, confidence)
+    if not user_ids:
+        return summary.result()
+    offsets, targets = social_graph.to_csr()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = (source_stats(offsets, targets, user_id) for user_id in user_ids)
+        return _collect(results, summary, len(user_ids), progress)
+    # the CSR arrays are shipped to each worker once, not once per source
+    with ProcessPoolExecutor(workers, initializer=_init_stats_worker, initargs=(offsets, targets)) as pool:
+        results = pool.map(_stats_from, user_ids, chunksize=max(1, len(user_ids) // (workers * 16)))
+        return _collect(results, summary, len(user_ids), progress)
+
+
+def _collect(results, summary, total, progress):
+    for done, stats in enumerate(results, 1):
+        summary.add(stats)
+        if progress is not None:
+            progress(done, total, summary.result())
+    return summary.result()
+
+
+class _Summary:
+    """Running means and variances (Welford's method) of per-source reach and separation."""
+
+    def __init__(self, num_users, confidence):
+        self.num_users = num_users
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.reach = _RunningMean()
+        self.separation = _RunningMean()
+        self.diameter = 0
+
+    def add(self, stats):
+        others = self.num_users - 1
+        self.reach.add(100 * stats.reached / others if others else 0.0)
+        if stats.reached:
+            self.separation.add(stats.total_separation / stats.reached)
+        self.diameter = max(self.diameter, stats.eccentricity)
+
+    def result(self):
+        return NetworkStats(
+            self.reach.count,
+            self.separation.mean,
+            self.separation.interval(self.z, self._population(self.separation)),
+            self.reach.mean,
+            self.reach.interval(self.z, self.num_users),
+            self.diameter,
+            self.reach.count == self.num_users,
+        )
+
+    def _population(self, running):
+        # users with friends, estimated from the sample, bound the separation population
+        if not self.reach.count:
+            return running.count
+        return max(running.count, round(self.num_users * running.count / self.reach.count))
+
+
+class _RunningMean:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared differences from the mean
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def interval(self, z, population):
+        """Normal-approximation interval for the population mean, from a sample drawn without replacement."""
+        if self.count >= population:
+            return self.mean, self.mean
+        if self.count < 2:
+            return -math.inf, math.inf
+        standard_error = math.sqrt(self.m2 / (self.count - 1) / self.count)
+        # finite population correction: the interval shrinks to nothing as the sample covers everyone
+        standard_error *= math.sqrt((population - self.count) / (population - 1))
+        return self.mean - z * standard_error, self.mean + z * standard_error
+
+
+# per-process state for network_stats
+_worker_offsets = None
+_worker_targets = None
+
+
+def _init_stats_worker(offsets, targets):
+    global _worker_offsets, _worker_targets
+    _worker_offsets, _worker_targets = offsets, targets
+
+
+def _stats_from(user_id):
+    return source_stats(_worker_offsets, _worker_targets, user_id)
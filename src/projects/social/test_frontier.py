@@ -0,0 +1,72 @@
+import random
+import unittest
+from array import array
+from collections import deque
+
+import frontier
+from frontier import UNREACHED, frontier_bfs
+
+
+def random_csr(rng, num_vertices, num_edges):
+    neighbors = [[] for _ in range(num_vertices)]
+    for _ in range(num_edges):
+        neighbors[rng.randrange(num_vertices)].append(rng.randrange(num_vertices))
+    offsets = array("q", [0])
+    targets = array("i")
+    for vert_neighbors in neighbors:
+        targets.extend(vert_neighbors)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def queue_bfs_distances(offsets, targets, source):
+    distances = [UNREACHED] * (len(offsets) - 1)
+    distances[source] = 0
+    q = deque([source])
+    while q:
+        vert = q.popleft()
+        for next_vert in targets[offsets[vert]:offsets[vert + 1]]:
+            if distances[next_vert] == UNREACHED:
+                distances[next_vert] = distances[vert] + 1
+                q.append(next_vert)
+    return distances
+
+
+class FrontierTest(unittest.TestCase):
+    def check_tree(self, offsets, targets, source, distances, parents):
+        self.assertEqual(list(distances), queue_bfs_distances(offsets, targets, source))
+        self.assertEqual(parents[source], UNREACHED)
+        for vert, parent in enumerate(parents):
+            if vert != source and distances[vert] != UNREACHED:
+                # every parent is a neighbor one level closer to the source
+                self.assertIn(vert, targets[offsets[parent]:offsets[parent + 1]])
+                self.assertEqual(distances[parent], distances[vert] - 1)
+
+    def test_python_backend(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            offsets, targets = random_csr(rng, rng.randint(1, 60), rng.randint(0, 150))
+            source = rng.randrange(len(offsets) - 1)
+            distances, parents = frontier._frontier_bfs_python(offsets, targets, source, len(offsets) - 1)
+            self.check_tree(offsets, targets, source, distances, parents)
+
+    @unittest.skipIf(frontier.np is None, "NumPy is not installed")
+    def test_numpy_backend_matches_python(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            offsets, targets = random_csr(rng, rng.randint(1, 60), rng.randint(0, 150))
+            source = rng.randrange(len(offsets) - 1)
+            num_vertices = len(offsets) - 1
+            distances, parents = frontier._frontier_bfs_numpy(offsets, targets, source, num_vertices)
+            python_distances, _ = frontier._frontier_bfs_python(offsets, targets, source, num_vertices)
+            self.assertEqual(distances.tolist(), list(python_distances))
+            self.check_tree(offsets, targets, source, distances.tolist(), parents.tolist())
+
+    def test_bad_source(self):
+        offsets, targets = random_csr(random.Random(2), 5, 5)
+        with self.assertRaises(IndexError):
+            frontier_bfs(offsets, targets, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,11 @@
+import sys
 import unittest
+from collections import Counter
 
+import engines
+from cache import BFSTreeCache, tree_size
 from social import SocialGraph
+from stats import network_stats
 
 
 class SocialNetworkTest(unittest.TestCase):
@@ -31,6 +36,204 @@ class SocialNetworkTest(unittest.TestCase):
         expected_result = {1: [1], 8: [1, 8], 10: [1, 10], 5: [1, 5], 2: [1, 10, 2], 6: [1, 10, 6], 7: [1, 10, 2, 7]}
         self.assertEqual(actual_result, expected_result)
 
+    def test_get_all_social_paths_is_shortest(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(300, 3, seed=7)
+
+        paths = social_graph.get_all_social_paths(1)
+        for friend_id in paths:
+            path = paths[friend_id]
+            self.assertEqual(path[0], 1)
+            self.assertEqual(path[-1], friend_id)
+            self.assertEqual(len(path), len(social_graph.get_shortest_path(1, friend_id)))
+        self.assertNotIn(-1, paths)
+        with self.assertRaises(KeyError):
+            paths[-1]
+
+    def test_hybrid_engine(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(2000, 10, seed=3)
+
+        top_down_stats = {}
+        hybrid_stats = {}
+        top_down = social_graph.get_all_social_paths(1)
+        hybrid = social_graph.get_all_social_paths(1, engine="hybrid")
+        self.assertEqual(top_down.keys(), hybrid.keys())
+        for friend_id in top_down:
+            path = hybrid[friend_id]
+            self.assertEqual(len(path), len(top_down[friend_id]))
+            for user_id, next_user in zip(path, path[1:]):
+                self.assertIn(next_user, social_graph.friendships[user_id])
+
+        engines.top_down_bfs(social_graph.friendships, 1, stats=top_down_stats)
+        engines.hybrid_bfs(social_graph.friendships, 1, stats=hybrid_stats)
+        self.assertGreater(hybrid_stats["bottom_up_levels"], 0)
+        self.assertLess(hybrid_stats["edge_checks"], top_down_stats["edge_checks"])
+
+        self.assertEqual(len(social_graph.get_shortest_path(1, 2, engine="hybrid")),
+                         len(social_graph.get_shortest_path(1, 2)))
+        with self.assertRaises(ValueError):
+            social_graph.get_shortest_path(1, 2, engine="sideways")
+
+    def test_get_shortest_paths(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(500, 2, seed=5)
+
+        pairs = [(1, 2), (3, 4), (1, 5), (1, 1), (7, 300), (3, 9), (1, 2)]
+        expected = [social_graph.get_shortest_path(*pair) for pair in pairs]
+        for workers in (1, 2):
+            paths = social_graph.get_shortest_paths(pairs, workers=workers)
+            self.assertEqual(len(paths), len(pairs))
+            for pair, path, expected_path in zip(pairs, paths, expected):
+                if expected_path is None:
+                    self.assertIsNone(path)
+                else:
+                    self.assertEqual((path[0], path[-1]), pair)
+                    self.assertEqual(len(path), len(expected_path))
+
+    def test_tree_cache(self):
+        cache = BFSTreeCache(max_entries=2)
+        social_graph = SocialGraph(tree_cache=cache)
+        social_graph.populate_graph(200, 4, seed=9)
+
+        first = social_graph.get_all_social_paths(1)
+        self.assertEqual(social_graph.get_shortest_path(1, 2), first[2])
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        social_graph.get_all_social_paths(2)
+        social_graph.get_all_social_paths(3)  # evicts user 1's tree
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(len(cache), 2)
+
+        # a new friendship bumps the version, so user 3's tree is rebuilt
+        social_graph.add_user("late joiner")
+        social_graph.add_friendship(3, 201)
+        self.assertEqual(social_graph.get_shortest_path(3, 201), [3, 201])
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_tree_cache_byte_budget(self):
+        cache = BFSTreeCache(max_entries=100, max_bytes=1)
+        cache.put(1, 0, {1: None})
+        self.assertEqual(len(cache), 0)
+
+        cache = BFSTreeCache(max_entries=100, max_bytes=500)
+        for user_id in range(10):
+            cache.put(user_id, 0, {user_id: None})
+        self.assertLessEqual(cache.bytes, 500)
+        self.assertGreater(cache.evictions, 0)
+        self.assertIsNone(cache.get(0, 0))
+        self.assertEqual(cache.get(9, 0), {9: None})
+
+        # the budget covers the ints in a tree, not just its hash table
+        parents = {user_id: user_id - 1 for user_id in range(1000, 2000)}
+        self.assertEqual(tree_size(parents), sys.getsizeof(parents) + sum(sys.getsizeof(key) for key in parents))
+        cache = BFSTreeCache(max_bytes=tree_size(parents) - 1)
+        cache.put(1000, 0, parents)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_social_distances(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(300, 3, seed=7)
+
+        paths = social_graph.get_all_social_paths(1)
+        distances, parents = social_graph.get_social_distances(1)
+        for friend_id in range(1, 301):
+            if friend_id in paths:
+                self.assertEqual(distances[friend_id], len(paths[friend_id]) - 1)
+            else:
+                self.assertEqual(distances[friend_id], -1)
+        self.assertEqual(parents[1], -1)
+
+        # the cached CSR is rebuilt after the graph changes
+        social_graph.add_user("late joiner")
+        social_graph.add_friendship(1, 301)
+        self.assertEqual(social_graph.get_social_distances(1)[0][301], 1)
+
+    def test_components(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(400, 1, seed=3)  # sparse enough to leave many separate networks
+
+        sizes = Counter()
+        for user_id in range(1, 401):
+            network = social_graph.get_all_social_paths(user_id)
+            self.assertEqual(social_graph.get_component_size(user_id), len(network))
+            for friend_id in network:
+                self.assertEqual(social_graph.get_component_id(friend_id), social_graph.get_component_id(user_id))
+            if min(network) == user_id:  # count each network once
+                sizes[len(network)] += 1
+        self.assertEqual(social_graph.get_component_sizes(), sizes)
+
+        # a new friendship merges two networks and the histogram follows
+        loners = [user_id for user_id in range(1, 401) if social_graph.get_component_size(user_id) == 1]
+        social_graph.add_friendship(loners[0], loners[1])
+        sizes[1] -= 2
+        sizes[2] += 1
+        self.assertEqual(social_graph.get_component_sizes(), +sizes)
+        self.assertEqual(social_graph.get_component_id(loners[0]), social_graph.get_component_id(loners[1]))
+
+    def test_network_stats(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(300, 3, seed=11)
+
+        # the same numbers the README asks for, the slow way
+        reach, separation, diameter = [], [], 0
+        for user_id in social_graph.users:
+            degrees = [len(path) - 1 for friend_id, path in social_graph.get_all_social_paths(user_id).items()
+                       if friend_id != user_id]
+            reach.append(100 * len(degrees) / 299)
+            if degrees:
+                separation.append(sum(degrees) / len(degrees))
+                diameter = max(diameter, max(degrees))
+
+        updates = []
+        stats = network_stats(social_graph, workers=1, progress=lambda done, total, _: updates.append((done, total)))
+        self.assertTrue(stats.exact)
+        self.assertEqual(stats.sources, 300)
+        self.assertAlmostEqual(stats.reach_percentage, sum(reach) / len(reach))
+        self.assertAlmostEqual(stats.average_separation, sum(separation) / len(separation))
+        self.assertEqual(stats.separation_interval, (stats.average_separation, stats.average_separation))
+        self.assertEqual(stats.diameter, diameter)
+        self.assertEqual(updates, [(done, 300) for done in range(1, 301)])
+
+        self.assertEqual(network_stats(social_graph, workers=2), stats)
+
+        sampled = network_stats(social_graph, samples=60, seed=5, workers=1)
+        self.assertFalse(sampled.exact)
+        self.assertEqual(sampled.sources, 60)
+        low, high = sampled.separation_interval
+        self.assertLess(low, high)
+        self.assertLessEqual(low, stats.average_separation)
+        self.assertLessEqual(stats.average_separation, high)
+        self.assertLessEqual(sampled.diameter, stats.diameter)
+
+    def test_populate_graph(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(1000, 5, seed=42)
+
+        self.assertEqual(len(social_graph.users), 1000)
+        # every friendship is stored on both sides
+        total_friends = sum(len(friends) for friends in social_graph.friendships.values())
+        self.assertEqual(total_friends, 1000 * 5)
+        for user_id, friends in social_graph.friendships.items():
+            self.assertNotIn(user_id, friends)
+            for friend_id in friends:
+                self.assertIn(user_id, social_graph.friendships[friend_id])
+
+        same_seed = SocialGraph()
+        same_seed.populate_graph(1000, 5, seed=42)
+        self.assertEqual(same_seed.friendships, social_graph.friendships)
+
+    def test_populate_graph_too_many_friends(self):
+        social_graph = SocialGraph()
+        social_graph.populate_graph(10, 2, seed=1)
+        friendships = {user_id: set(friends) for user_id, friends in social_graph.friendships.items()}
+        with self.assertRaises(ValueError):
+            social_graph.populate_graph(5, 5)
+        # the failed call left the existing network alone
+        self.assertEqual(len(social_graph.users), 10)
+        self.assertEqual(social_graph.friendships, friendships)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -63,3 +63,70 @@ def earliest_ancestor_doc(ancestors, starting_node):
             q.enqueue(path_copy)
 
     return early_ancestor
+
+
+class AncestryIndex:
+    """
+    Reusable index for earliest-ancestor queries over a list of (parent, child) pairs.
+
+    The reversed (child -> parents) adjacency is built once. Each person's
+    (depth, earliest ancestor) is then worked out at most once with a DAG
+    dynamic program and memoized. Repeated queries are O(1) after warm-up,
+    and earliest_ancestors() answers every person in O(V + E) overall.
+    """
+
+    def __init__(self, ancestors):
+        self.parents = {}  # child -> list of parents
+        for parent, child in ancestors:
+            self.parents.setdefault(child, []).append(parent)
+            self.parents.setdefault(parent, [])
+        # person -> (generations back to their earliest ancestor, earliest ancestor or themselves)
+        self.memo = {}
+
+    def earliest_ancestor(self, starting_node):
+        """Return the earliest ancestor of starting_node, or -1 if they have no parents."""
+        depth, ancestor = self.lineage(starting_node)
+        return ancestor if depth > 0 else -1
+
+    def depth(self, starting_node):
+        """Return how many generations separate starting_node from their earliest ancestor."""
+        return self.lineage(starting_node)[0]
+
+    def earliest_ancestors(self):
+        """Return a dict mapping every person in the index to their earliest ancestor (or -1)."""
+        return {person: self.earliest_ancestor(person) for person in self.parents}
+
+    def lineage(self, starting_node):
+        """Return (depth, earliest ancestor) for starting_node; a person with no parents is (0, themselves)."""
+        if starting_node not in self.memo:
+            self._resolve(starting_node)
+        return self.memo[starting_node]
+
+    def _resolve(self, starting_node):
+        # iterative post-order DFS up the parent links, so deep lineages never hit the recursion limit
+        memo = self.memo
+        in_progress = set()
+        stack = [(starting_node, False)]
+        while stack:
+            person, parents_done = stack.pop()
+            if person in memo:
+                continue
+            parents = self.parents.get(person, ())
+            if parents_done:
+                in_progress.discard(person)
+                best_depth, best_ancestor = 0, person
+                for parent in parents:
+                    depth, ancestor = memo[parent]
+                    depth += 1
+                    # the farthest ancestor wins; ties go to the lowest ID
+                    if depth > best_depth or (depth == best_depth and ancestor < best_ancestor):
+                        best_depth, best_ancestor = depth, ancestor
+                memo[person] = (best_depth, best_ancestor)
+            else:
+                if person in in_progress:
+                    raise ValueError(f"{person} is their own ancestor!")
+                in_progress.add(person)
+                stack.append((person, True))
+                for parent in parents:
+                    if parent not in memo:
+                        stack.append((parent, False))
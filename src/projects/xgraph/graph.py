@@ -1,15 +1,22 @@
+from array import array
 from collections import deque
 
+from frontier import UNREACHED, frontier_bfs
+from util import IntQueue
+
 
 class Graph:
     """Represent a graph as a dictionary of vertices mapping labels to edges."""
 
     def __init__(self):
         self.vertices = {}
+        self.version = 0  # bumped on every change so the cached frozen copy goes stale
+        self._frozen = None  # (version, FrozenGraph) built by freeze
 
     def add_vertex(self, vertex_id):
         """Add a vertex to the graph."""
         self.vertices[vertex_id] = set()
+        self.version += 1
 
     def add_edge(self, v1, v2):
         """Add a directed edges to the graph."""
@@ -19,6 +26,7 @@ class Graph:
             raise KeyError(f"{v2} is not a node in this graph!")
         else:
             self.vertices[v1].add(v2)
+            self.version += 1
 
     def get_neighbors(self, vertex_id):
         """Get all neighbors (edges) of a vertex."""
@@ -27,42 +35,126 @@ class Graph:
         else:
             raise KeyError(f"{vertex_id} is not a node in this graph!")
 
+    def freeze(self):
+        """
+        Return a read-only FrozenGraph copy of this graph stored as compressed sparse rows.
+
+        The copy is cached until add_vertex or add_edge changes the graph.
+        """
+        if self._frozen is None or self._frozen[0] != self.version:
+            self._frozen = (self.version, self._build_frozen())
+        return self._frozen[1]
+
+    def _build_frozen(self):
+        labels = list(self.vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array(FrozenGraph.target_typecode(len(labels)))
+        for label in labels:
+            targets.extend(index[next_vert] for next_vert in self.vertices[label])
+            offsets.append(len(targets))
+        return FrozenGraph(labels, offsets, targets)
+
+    def _adjacent(self, vert):
+        """Neighbors of vert as seen by the traversal engines (labels here, indices in FrozenGraph)."""
+        return self.get_neighbors(vert)
+
     def bft(self, starting_vertex):
         """Print each vertex in breadth-first order beginning from starting_vertex."""
-        q = deque()
-        q.append(starting_vertex)
-        visited = set()  # every element is unique (no duplicates)
-        while q:  # q will equate to FALSE if empty
-            vert = q.popleft()
-            if vert not in visited:
-                print(vert)
-                visited.add(vert)
-                for next_vert in self.vertices[vert]:
-                    q.append(next_vert)
+        for vert in self.iter_bft(starting_vertex):
+            print(vert)
 
     def dft(self, starting_vertex):
         """Print each vertex in depth-first order beginning from starting_vertex."""
+        for vert in self.iter_dft(starting_vertex):
+            print(vert)
+
+    def iter_bft(self, starting_vertex, max_depth=None, max_visits=None):
+        """
+        Yield each vertex in breadth-first order beginning from starting_vertex.
+
+        Vertices more than max_depth edges away from starting_vertex are not
+        visited, and iteration stops after max_visits vertices. Either limit
+        may be None for no limit.
+        """
+        if max_visits is not None and max_visits <= 0:
+            return
+        q = deque()
+        q.append((starting_vertex, 0))
+        visited = {starting_vertex}  # mark on enqueue so each vertex is queued once
+        visits = 0
+        while q:  # q will equate to FALSE if empty
+            vert, depth = q.popleft()
+            yield vert
+            visits += 1
+            if visits == max_visits:
+                return
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for next_vert in self._adjacent(vert):
+                if next_vert not in visited:
+                    visited.add(next_vert)
+                    q.append((next_vert, depth + 1))
+
+    def iter_dft(self, starting_vertex, max_depth=None, max_visits=None):
+        """
+        Yield each vertex in depth-first order beginning from starting_vertex.
+
+        Vertices more than max_depth edges from starting_vertex are not
+        visited, and iteration stops after max_visits vertices. Either limit
+        may be None for no limit.
+        """
+        if max_visits is not None and max_visits <= 0:
+            return
         stack = deque()
-        stack.append(starting_vertex)
-        visited = set()
+        stack.append((starting_vertex, 0))
+        depths = {}  # shallowest depth each visited vertex has been reached at
+        visits = 0
         while stack:  # stack will equate to FALSE if empty
-            vert = stack.pop()  # take vertex off the top of stack (end of deque)
-            if vert not in visited:
-                print(vert)
-                visited.add(vert)
-                for next_vert in self.get_neighbors(vert):
-                    stack.append(next_vert)
+            vert, depth = stack.pop()  # take vertex off the top of stack (end of deque)
+            if vert not in depths:
+                yield vert
+                depths[vert] = depth
+                visits += 1
+                if visits == max_visits:
+                    return
+            elif max_depth is not None and depth < depths[vert]:
+                # reached again by a shorter path: its neighbors may now be within max_depth
+                depths[vert] = depth
+            else:
+                continue
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for next_vert in self._adjacent(vert):
+                stack.append((next_vert, depth + 1))
 
     def dft_recursive(self, starting_vertex, visited=None):
         """Print each vertex in depth-first order beginning from starting_vertex."""
         if not visited:
             visited = set()
-        visited.add(starting_vertex)
-        print(starting_vertex)  # print before recurse/loop
-        for next_vert in self.vertices[starting_vertex]:
-            # if next_vert hasn't been visited yet -- let's visit it!
-            if next_vert not in visited:
-                self.dft_recursive(next_vert, visited)
+        self._dft_recursive_visit(starting_vertex, visited, print)
+
+    def _dft_recursive_visit(self, vert, visited, visit):
+        """
+        Call visit on vert and then on each unvisited neighbor's subtree, in recursive pre-order.
+
+        The call stack is replaced by an explicit stack holding one neighbor iterator per
+        vertex we are still "inside", so the Python stack depth stays constant however
+        long the paths in the graph get.
+        """
+        visited.add(vert)
+        visit(vert)  # visit before recurse/loop
+        stack = [iter(self._adjacent(vert))]
+        while stack:
+            for next_vert in stack[-1]:
+                # if next_vert hasn't been visited yet -- let's visit it!
+                if next_vert not in visited:
+                    visited.add(next_vert)
+                    visit(next_vert)
+                    stack.append(iter(self._adjacent(next_vert)))  # "recurse" into next_vert
+                    break
+            else:
+                stack.pop()  # every neighbor is done -- "return" to the vertex below
 
     def bfs(self, starting_vertex, destination_vertex):
         """
@@ -70,21 +162,7 @@ class Graph:
         starting_vertex to destination_vertex in
         breath-first order.
         """
-        q = deque()
-        q.append([starting_vertex])  # creating a series of lists
-        # the queue contains each possible path from point a to point b
-        visited = set()
-        while q:
-            path = q.popleft()
-            vert = path[-1]
-            if vert not in visited:
-                if vert == destination_vertex:
-                    return path
-                visited.add(vert)
-                for next_vert in self.get_neighbors(vert):
-                    new_path = path + [next_vert]
-                    # new_path.append(next_vert)
-                    q.append(new_path)
+        return self._search(starting_vertex, destination_vertex, breadth_first=True)
 
     def dfs(self, starting_vertex, destination_vertex):
         """
@@ -92,47 +170,262 @@ class Graph:
         starting_vertex to destination_vertex in
         depth-first order.
         """
-        stack = deque()
-        stack.append([starting_vertex])  # stack will contain list of paths
-        visited = set()
-        while len(stack) > 0:
-            path = stack.pop()
-            vert = path[-1]
-            if vert not in visited:
-                if vert == destination_vertex:
-                    return path
-                visited.add(vert)
-                for next_vert in self.get_neighbors(vert):
-                    new_path = list(path)
-                    new_path.append(next_vert)
-                    stack.append(new_path)
+        return self._search(starting_vertex, destination_vertex, breadth_first=False)
 
-    def dfs_recursive(self, starting_vertex, destination_vertex, visited=None, path=None):
+    def dfs_recursive(self, starting_vertex, destination_vertex):
         """
         Return a list containing a path from
         starting_vertex to destination_vertex in
         depth-first order.
 
-        This should be done using recursion.
+        This follows the recursive algorithm exactly, but on an explicit
+        stack, so it works on paths far longer than the recursion limit.
         """
+        parents = {starting_vertex: None}
+        if self._dfs_recursive_visit(starting_vertex, destination_vertex, parents):
+            return self._build_path(parents, destination_vertex)
 
-        if not visited:
-            visited = set()
+    def _dfs_recursive_visit(self, vert, destination_vertex, parents):
+        """
+        Search from vert in recursive pre-order, recording parents; return True once destination_vertex is reached.
 
-        if not path:
-            path = []
+        Like _dft_recursive_visit, the recursion runs on an explicit stack of
+        (vertex, neighbor iterator) frames.
+        """
+        if vert == destination_vertex:
+            return True
+        stack = [(vert, iter(self._adjacent(vert)))]
+        while stack:
+            vert, children = stack[-1]
+            for child_vert in children:
+                if child_vert not in parents:
+                    parents[child_vert] = vert
+                    if child_vert == destination_vertex:
+                        return True
+                    stack.append((child_vert, iter(self._adjacent(child_vert))))
+                    break
+            else:
+                stack.pop()
+        return False
 
-        visited.add(starting_vertex)
-        path = path + [starting_vertex]
+    def bfs_distances(self, starting_vertex):
+        """
+        Return (distances, parents) dictionaries for every vertex reachable from starting_vertex.
 
-        if starting_vertex == destination_vertex:
-            return path
+        distances maps a vertex to its edge count from starting_vertex and parents maps it to
+        the vertex it was reached from (None for starting_vertex). The search expands one whole
+        BFS level at a time over the cached frozen CSR copy of the graph (see freeze).
+        """
+        return self.freeze().bfs_distances(starting_vertex)
+
+    def _search(self, starting_vertex, destination_vertex, breadth_first):
+        """
+        Search core shared by bfs and dfs.
+
+        The frontier holds (vertex, parent) pairs instead of whole paths, and
+        every visited vertex is stored once in the parents dict. The path is
+        only rebuilt when destination_vertex is found.
+        """
+        frontier = deque()
+        frontier.append((starting_vertex, None))
+        # a queue pops from the front, a stack from the back
+        pop = frontier.popleft if breadth_first else frontier.pop
+        parents = {}  # doubles as our visited set
+        while frontier:
+            vert, parent = pop()
+            if vert not in parents:
+                parents[vert] = parent
+                if vert == destination_vertex:
+                    return self._build_path(parents, destination_vertex)
+                for next_vert in self._adjacent(vert):
+                    if next_vert not in parents:
+                        frontier.append((next_vert, vert))
+
+    @staticmethod
+    def _build_path(parents, destination_vertex):
+        """Walk the parent pointers back from destination_vertex and return the path in order."""
+        path = []
+        vert = destination_vertex
+        while vert is not None:
+            path.append(vert)
+            vert = parents[vert]
+        path.reverse()
+        return path
+
+
+class FrozenGraph(Graph):
+    """
+    Read-only graph stored in compressed sparse row (CSR) form.
+
+    Vertex labels are mapped to integer indices 0..n-1. The neighbors of the
+    vertex at index i are targets[offsets[i]:offsets[i + 1]], so each edge costs
+    one machine integer instead of a set entry. The traversal and search methods
+    from Graph run on the indices and translate back to labels at the boundary.
+    """
+
+    def __init__(self, labels, offsets, targets):
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("offsets must have exactly one more entry than labels")
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+
+    @staticmethod
+    def target_typecode(num_vertices):
+        """Smallest array typecode that can hold every vertex index."""
+        return "i" if num_vertices < 2 ** 31 else "q"
+
+    @property
+    def vertices(self):
+        """Rebuild the dictionary-of-sets view of this graph (a copy, so it is O(V + E))."""
+        return {label: set(self.get_neighbors(label)) for label in self.labels}
+
+    def add_vertex(self, vertex_id):
+        raise TypeError("cannot add a vertex to a frozen graph")
+
+    def add_edge(self, v1, v2):
+        raise TypeError("cannot add an edge to a frozen graph")
+
+    def freeze(self):
+        return self
+
+    def get_neighbors(self, vertex_id):
+        """Get all neighbors (edges) of a vertex."""
+        labels = self.labels
+        return [labels[i] for i in self._adjacent(self._index_of(vertex_id))]
+
+    def _adjacent(self, vert):
+        return self.targets[self.offsets[vert]:self.offsets[vert + 1]]
+
+    def _index_of(self, vertex_id):
+        if vertex_id in self.index:
+            return self.index[vertex_id]
+        else:
+            raise KeyError(f"{vertex_id} is not a node in this graph!")
+
+    def _labels_of(self, path):
+        if path is not None:
+            labels = self.labels
+            return [labels[i] for i in path]
+
+    def iter_bft(self, starting_vertex, max_depth=None, max_visits=None):
+        if max_visits is not None and max_visits <= 0:
+            return
+        labels, offsets, targets = self.labels, self.offsets, self.targets
+        vert = self._index_of(starting_vertex)
+        # each vertex is queued at most once, so a queue and visited flags sized to the graph suffice
+        q = IntQueue(len(labels))
+        visited = bytearray(len(labels))
+        q.enqueue(vert)
+        visited[vert] = 1
+        depth = 0
+        level_left = 1  # vertices at the current depth still waiting in q
+        visits = 0
+        while q.size() > 0:
+            vert = q.dequeue()
+            yield labels[vert]
+            visits += 1
+            if visits == max_visits:
+                return
+            if max_depth is None or depth < max_depth:
+                for next_vert in targets[offsets[vert]:offsets[vert + 1]]:
+                    if not visited[next_vert]:
+                        visited[next_vert] = 1
+                        q.enqueue(next_vert)
+            level_left -= 1
+            if level_left == 0:
+                # everything left in q is one level deeper
+                depth += 1
+                level_left = q.size()
+
+    def iter_dft(self, starting_vertex, max_depth=None, max_visits=None):
+        labels = self.labels
+        for vert in super().iter_dft(self._index_of(starting_vertex), max_depth, max_visits):
+            yield labels[vert]
+
+    def dft_recursive(self, starting_vertex, visited=None):
+        labels = self.labels
+        visited = {self._index_of(vert) for vert in visited} if visited else set()
+        self._dft_recursive_visit(self._index_of(starting_vertex), visited, lambda vert: print(labels[vert]))
+
+    def _dft_recursive_visit(self, vert, visited, visit):
+        # each stack frame is just a vertex and a cursor into targets: two machine integers
+        offsets, targets = self.offsets, self.targets
+        visited.add(vert)
+        visit(vert)
+        verts = array("q", [vert])
+        cursors = array("q", [offsets[vert]])
+        while verts:
+            vert = verts[-1]
+            cursor, end = cursors[-1], offsets[vert + 1]
+            while cursor < end and targets[cursor] in visited:
+                cursor += 1
+            if cursor == end:
+                verts.pop()
+                cursors.pop()
+                continue
+            cursors[-1] = cursor + 1
+            next_vert = targets[cursor]
+            visited.add(next_vert)
+            visit(next_vert)
+            verts.append(next_vert)
+            cursors.append(offsets[next_vert])
+
+    def _dfs_recursive_visit(self, vert, destination_vertex, parents):
+        offsets, targets = self.offsets, self.targets
+        if vert == destination_vertex:
+            return True
+        verts = array("q", [vert])
+        cursors = array("q", [offsets[vert]])
+        while verts:
+            vert = verts[-1]
+            cursor, end = cursors[-1], offsets[vert + 1]
+            while cursor < end and targets[cursor] in parents:
+                cursor += 1
+            if cursor == end:
+                verts.pop()
+                cursors.pop()
+                continue
+            cursors[-1] = cursor + 1
+            child_vert = targets[cursor]
+            parents[child_vert] = vert
+            if child_vert == destination_vertex:
+                return True
+            verts.append(child_vert)
+            cursors.append(offsets[child_vert])
+        return False
+
+    def bfs_tree(self, starting_vertex):
+        """
+        Return (distances, parents) arrays indexed by vertex index, from one level-synchronous BFS.
+
+        Unreachable vertices (and the parent of starting_vertex) hold frontier.UNREACHED.
+        """
+        return frontier_bfs(self.offsets, self.targets, self._index_of(starting_vertex))
+
+    def bfs_distances(self, starting_vertex):
+        labels = self.labels
+        distances, parents = self.bfs_tree(starting_vertex)
+        vert_distances = {}
+        vert_parents = {}
+        for vert, (distance, parent) in enumerate(zip(distances.tolist(), parents.tolist())):
+            if distance != UNREACHED:
+                vert_distances[labels[vert]] = distance
+                vert_parents[labels[vert]] = labels[parent] if parent != UNREACHED else None
+        return vert_distances, vert_parents
+
+    # an unknown destination maps to index -1, which no search can reach
+    def bfs(self, starting_vertex, destination_vertex):
+        return self._labels_of(super().bfs(self._index_of(starting_vertex), self.index.get(destination_vertex, -1)))
+
+    def dfs(self, starting_vertex, destination_vertex):
+        return self._labels_of(super().dfs(self._index_of(starting_vertex), self.index.get(destination_vertex, -1)))
 
-        for child_vert in self.get_neighbors(starting_vertex):
-            if child_vert not in visited:
-                new_path = self.dfs_recursive(child_vert, destination_vertex, visited, path)
-                if new_path:
-                    return new_path
+    def dfs_recursive(self, starting_vertex, destination_vertex):
+        return self._labels_of(
+            super().dfs_recursive(self._index_of(starting_vertex), self.index.get(destination_vertex, -1))
+        )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,43 @@
+import unittest
+
+from ancestor2 import AncestryIndex
+
+'''
+   10
+ /
+1   2   4  11
+ \\ /   / \\ /
+  3   5   8
+   \\ / \\   \\
+    6   7   9
+'''
+test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
+
+
+class AncestryIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = AncestryIndex(test_ancestors)
+
+    def test_earliest_ancestor(self):
+        expected = {1: 10, 2: -1, 3: 10, 4: -1, 5: 4, 6: 10, 7: 4, 8: 4, 9: 4, 10: -1, 11: -1}
+        for person, ancestor in expected.items():
+            self.assertEqual(self.index.earliest_ancestor(person), ancestor)
+        self.assertDictEqual(self.index.earliest_ancestors(), expected)
+
+    def test_depth(self):
+        self.assertEqual(self.index.depth(6), 3)
+        self.assertEqual(self.index.depth(9), 2)
+        self.assertEqual(self.index.depth(10), 0)
+
+    def test_deep_chain(self):
+        chain = AncestryIndex((person + 1, person) for person in range(100000))
+        self.assertEqual(chain.earliest_ancestor(0), 100000)
+        self.assertEqual(chain.depth(50000), 50000)
+
+    def test_cycle(self):
+        with self.assertRaises(ValueError):
+            AncestryIndex([(1, 2), (2, 3), (3, 1)]).earliest_ancestor(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
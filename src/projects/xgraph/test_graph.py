@@ -98,10 +98,50 @@ class Test(unittest.TestCase):
 
         sys.stdout = stdout_  # Restore stdout
 
+    def test_iter_bft(self):
+        order = list(self.graph.iter_bft(1))
+        self.assertEqual(order[:2], [1, 2])
+        self.assertCountEqual(order, [1, 2, 3, 4, 5, 6, 7])
+        self.assertCountEqual(self.graph.iter_bft(1, max_depth=2), [1, 2, 3, 4])
+        self.assertEqual(list(self.graph.iter_bft(1, max_visits=2)), [1, 2])
+        self.assertEqual(list(self.graph.iter_bft(1, max_visits=0)), [])
+
+    def test_iter_dft(self):
+        dft = [
+            [1, 2, 3, 5, 4, 6, 7],
+            [1, 2, 3, 5, 4, 7, 6],
+            [1, 2, 4, 7, 6, 3, 5],
+            [1, 2, 4, 6, 3, 5, 7]
+        ]
+        self.assertIn(list(self.graph.iter_dft(1)), dft)
+        self.assertEqual(list(self.graph.iter_dft(1, max_depth=1)), [1, 2])
+        self.assertEqual(list(self.graph.iter_dft(1, max_visits=3)), list(self.graph.iter_dft(1))[:3])
+        # 2 is first popped 2 edges down (via 3), but 4 is still only 2 edges from 1 (via 2)
+        graph = self.from_edges([1, 2, 3, 4], [(1, 2), (1, 3), (3, 2), (2, 4)])
+        self.assertCountEqual(graph.iter_dft(1, max_depth=2), [1, 2, 3, 4])
+        self.assertCountEqual(graph.iter_dft(1, max_depth=1), [1, 2, 3])
+
     def test_bfs(self):
         bfs = [1, 2, 4, 6]
         self.assertListEqual(self.graph.bfs(1, 6), bfs)
 
+    def test_bfs_distances(self):
+        distances, parents = self.graph.bfs_distances(1)
+        self.assertDictEqual(distances, {1: 0, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 3})
+        self.assertIsNone(parents[1])
+        for vert, parent in parents.items():
+            if parent is not None:
+                self.assertEqual(distances[parent] + 1, distances[vert])
+                self.assertIn(vert, self.graph.get_neighbors(parent))
+        self.assertDictEqual(self.graph.bfs_distances(5)[0], {5: 0, 3: 1})
+
+    def test_frozen_copy_follows_changes(self):
+        frozen = self.graph.freeze()
+        self.assertIs(self.graph.freeze(), frozen)  # reused until the graph changes
+        self.graph.add_edge(5, 7)
+        self.assertIsNot(self.graph.freeze(), frozen)
+        self.assertEqual(self.graph.bfs_distances(5)[0][7], 1)
+
     def test_dfs(self):
         dfs = [
             [1, 2, 4, 6],
@@ -116,6 +156,65 @@ class Test(unittest.TestCase):
         ]
         self.assertIn(self.graph.dfs_recursive(1, 6), dfs)
 
+    def from_edges(self, vertices, edges):
+        graph = Graph()
+        for vert in vertices:
+            graph.add_vertex(vert)
+        for v1, v2 in edges:
+            graph.add_edge(v1, v2)
+        return graph
+
+    def chain(self, length):
+        return self.from_edges(range(length), [(vert - 1, vert) for vert in range(1, length)])
+
+    def test_recursive_long_chain(self):
+        # far deeper than the recursion limit
+        length = 10 ** 5
+        graph = self.chain(length)
+        self.assertListEqual(graph.dfs_recursive(0, length - 1), list(range(length)))
+
+        stdout_ = sys.stdout
+        sys.stdout = io.StringIO()
+        graph.dft_recursive(0)
+        output = sys.stdout.getvalue()
+        sys.stdout = stdout_  # Restore stdout
+
+        self.assertEqual(output, "".join(f"{vert}\n" for vert in range(length)))
+
+    def test_search_unreachable_and_self(self):
+        self.graph.add_vertex(8)
+        for search in (self.graph.bfs, self.graph.dfs, self.graph.dfs_recursive):
+            self.assertIsNone(search(1, 8))
+            self.assertListEqual(search(4, 4), [4])
+
+
+class FrozenTest(Test):
+    """Run every Graph test again against the CSR copy of the same graph."""
+
+    def setUp(self):
+        super().setUp()
+        self.graph = self.graph.freeze()
+
+    def from_edges(self, vertices, edges):
+        return super().from_edges(vertices, edges).freeze()
+
+    def test_search_unreachable_and_self(self):
+        for search in (self.graph.bfs, self.graph.dfs, self.graph.dfs_recursive):
+            self.assertIsNone(search(1, 8))
+            self.assertListEqual(search(4, 4), [4])
+
+    def test_frozen_copy_follows_changes(self):
+        self.assertIs(self.graph.freeze(), self.graph)
+
+    def test_frozen(self):
+        self.assertEqual(len(self.graph.targets), 10)
+        self.assertEqual(self.graph.offsets[-1], 10)
+        self.assertCountEqual(self.graph.get_neighbors(4), [6, 7])
+        with self.assertRaises(TypeError):
+            self.graph.add_edge(1, 3)
+        with self.assertRaises(KeyError):
+            self.graph.get_neighbors(8)
+
 
 if __name__ == '__main__':
     unittest.main()
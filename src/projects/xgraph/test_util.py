@@ -0,0 +1,36 @@
+import unittest
+
+from util import IntQueue, Queue, Stack
+
+
+class UtilTest(unittest.TestCase):
+    def test_queue(self):
+        q = Queue()
+        for value in range(5):
+            q.enqueue(value)
+        self.assertEqual([q.dequeue() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertIsNone(q.dequeue())
+        self.assertEqual(q.size(), 0)
+
+    def test_stack(self):
+        s = Stack()
+        for value in range(5):
+            s.push(value)
+        self.assertEqual([s.pop() for _ in range(5)], [4, 3, 2, 1, 0])
+        self.assertIsNone(s.pop())
+
+    def test_int_queue_wraps_around(self):
+        q = IntQueue(3)
+        q.enqueue(1)
+        q.enqueue(2)
+        self.assertEqual(q.dequeue(), 1)
+        q.enqueue(3)
+        q.enqueue(4)  # lands in slot 0
+        with self.assertRaises(OverflowError):
+            q.enqueue(5)
+        self.assertEqual([q.dequeue() for _ in range(q.size())], [2, 3, 4])
+        self.assertIsNone(q.dequeue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,18 @@
-# Note: This Queue class is sub-optimal. Why?
+from array import array
+from collections import deque
+
+
+# Backed by a deque, so enqueue and dequeue are both O(1) -- list.pop(0) shifts every element.
 class Queue():
     def __init__(self):
-        self.queue = []
+        self.queue = deque()
 
     def enqueue(self, value):
         self.queue.append(value)
 
     def dequeue(self):
         if self.size() > 0:
-            return self.queue.pop(0)
+            return self.queue.popleft()
         else:
             return None
 
@@ -18,7 +22,7 @@ class Queue():
 
 class Stack():
     def __init__(self):
-        self.stack = []
+        self.stack = deque()
 
     def push(self, value):
         self.stack.append(value)
@@ -31,3 +35,42 @@ class Stack():
 
     def size(self):
         return len(self.stack)
+
+
+class IntQueue():
+    """
+    Fixed-capacity FIFO of integers in a preallocated ring buffer.
+
+    Meant for traversals over integer vertex indices (e.g. a CSR graph), where
+    each vertex is enqueued at most once and capacity can be the vertex count.
+    The values live in one flat array instead of a deque of Python objects.
+    """
+
+    def __init__(self, capacity, typecode="q"):
+        self.queue = array(typecode, [0]) * capacity
+        self.head = 0
+        self.count = 0
+
+    def enqueue(self, value):
+        capacity = len(self.queue)
+        if self.count == capacity:
+            raise OverflowError(f"IntQueue is full ({capacity} items)")
+        tail = self.head + self.count
+        if tail >= capacity:
+            tail -= capacity
+        self.queue[tail] = value
+        self.count += 1
+
+    def dequeue(self):
+        if self.count > 0:
+            value = self.queue[self.head]
+            self.head += 1
+            if self.head == len(self.queue):
+                self.head = 0
+            self.count -= 1
+            return value
+        else:
+            return None
+
+    def size(self):
+        return self.count
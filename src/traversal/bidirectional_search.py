@@ -1,65 +1,72 @@
 # Bi-Directional Search
 # Operates by running two BFS simultaneously, one from the starting node and one from the destination node
-# Each iteration, we'll take one step forward and one step back
-# Once the paths overlap, we know we've hit a short path
+# Each iteration, we expand one full BFS level of whichever side has the smaller frontier
+# Once the two searches touch, we know we've hit a shortest path
 #
-# Queue for FORWARD --- represents the next nodes to visit in the starting_node's BST
-# Queue for BACKWARD -- represents the next nodes to visit in the destination_node's BST
+# Frontier for FORWARD --- the current BFS level of the starting_node's search
+# Frontier for BACKWARD -- the current BFS level of the destination_node's search
+#
+# Each side keeps a parent map instead of a path per vertex, so a query that meets at depth d
+# explores roughly 2 * b^(d/2) vertices. The graph is treated as undirected: graph[vert] must
+# list every neighbour of vert.
 def bidi_search(graph, start, destination):
     if start == destination:
         return [start]
 
-    # dictionary of currently active vertices with their corresponding paths.
-    active_vert_paths = {
-        start: [start],  # path from start to _some_node_
-        destination: [destination]  # path from destination node to _some_node_
-    }
+    # vertex -> the vertex it was discovered from (None for each side's root)
+    forward_parents = {start: None}
+    backward_parents = {destination: None}
+    forward_frontier = [start]
+    backward_frontier = [destination]
+
+    # while both searches can still grow
+    while forward_frontier and backward_frontier:
+        # expand the smaller frontier -- it is the cheaper side to push out another level
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting_vertex = _expand_level(graph, forward_frontier,
+                                                             forward_parents, backward_parents)
+        else:
+            backward_frontier, meeting_vertex = _expand_level(graph, backward_frontier,
+                                                              backward_parents, forward_parents)
+
+        # the first meeting is already at the shortest distance: before this level the
+        # two visited sets were disjoint, so no shorter start -> destination path exists
+        if meeting_vertex is not None:
+            return _join_paths(forward_parents, backward_parents, meeting_vertex)
+
+
+def _expand_level(graph, frontier, parents, other_parents):
+    """
+    Visit every neighbour of one full BFS level.
+
+    Returns the next frontier and the first vertex the other side has already
+    visited (or None if the two searches have not met yet).
+    """
+    next_frontier = []
+    for vert in frontier:
+        for neighbour in graph[vert]:
+            if neighbour not in parents:
+                parents[neighbour] = vert
+                if neighbour in other_parents:
+                    return next_frontier, neighbour
+                next_frontier.append(neighbour)
+    return next_frontier, None
+
+
+def _join_paths(forward_parents, backward_parents, meeting_vertex):
+    """Follow both parent maps out from meeting_vertex and return the path from start to destination."""
+    path = []
+    vert = meeting_vertex
+    while vert is not None:
+        path.append(vert)
+        vert = forward_parents[vert]
+    path.reverse()
 
-    # will contain vertices that we've ruled out along the way
-    inactive_verts = set()
-
-    # while there are still potential solution paths
-    while active_vert_paths:
-        # every key in active_vert_paths is an active vertex
-        active_verts = list(active_vert_paths.keys())
-        # for every active vertex
-        for vert in active_verts:
-            current_path = active_vert_paths[vert]
-            origin = current_path[0]
-            current_neighbours = set(graph[vert]) - inactive_verts
-
-            # Check if our neighbours hit an active vertex
-            # This would happen once each BFS overlaps
-            # If this happens, we have a potential solution path
-            for meeting_vertex in current_neighbours.intersection(active_verts):
-                # Check that the two paths didn't start at same place.
-                # If not, then we've got a path from start to goal.
-                if origin != active_vert_paths[meeting_vertex][0]:
-                    # Reverse one of the paths.
-                    active_vert_paths[meeting_vertex].reverse()
-                    # combine the results
-                    joined_paths = active_vert_paths[vert] + active_vert_paths[meeting_vertex]
-                    # if joined_paths is in reverse order, we'll just reverse it
-                    if joined_paths[0] != start:
-                        joined_paths.reverse()
-                    # return our joined paths from start to end!
-                    return joined_paths
-
-            # if we're here, we did not find a solution at this level
-            # so check for new neighbours to extend our paths another level
-            new_neighbors = set(current_neighbours) - inactive_verts - set(active_verts)
-            if new_neighbors:
-                # If we have new neighbors — extend the paths, remove the previous one and update the inactive vertices.
-                for neighbor_vert in new_neighbors:
-                    active_vert_paths[neighbor_vert] = current_path + [neighbor_vert]
-                    active_verts.append(neighbor_vert)
-                active_vert_paths.pop(vert, None)
-                inactive_verts.add(vert)
-
-            else:
-                # Otherwise, if no new neighbors, then remove the current path and record the endpoint as inactive.
-                active_vert_paths.pop(vert, None)
-                inactive_verts.add(vert)
+    vert = backward_parents[meeting_vertex]
+    while vert is not None:
+        path.append(vert)
+        vert = backward_parents[vert]
+    return path
 
 
 if __name__ == '__main__':
@@ -1,4 +1,6 @@
+import random
 import unittest
+from collections import deque
 from bidirectional_search import bidi_search as bidirectional_search
 
 test_data_01 = {
@@ -92,5 +94,39 @@ class TestBiDirectionalSearchOneTo(unittest.TestCase, TestCase):
         )
 
 
+class TestBiDirectionalSearchRandomGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(11)
+        self.graph = {vert: set() for vert in range(500)}
+        for _ in range(700):
+            v1, v2 = rng.randrange(500), rng.randrange(500)
+            if v1 != v2:
+                self.graph[v1].add(v2)
+                self.graph[v2].add(v1)
+
+    def bfs_distances(self, start):
+        distances = {start: 0}
+        q = deque([start])
+        while q:
+            vert = q.popleft()
+            for neighbour in self.graph[vert]:
+                if neighbour not in distances:
+                    distances[neighbour] = distances[vert] + 1
+                    q.append(neighbour)
+        return distances
+
+    def test_matches_bfs_lengths(self):
+        distances = self.bfs_distances(0)
+        for end in self.graph:
+            path = bidirectional_search(self.graph, 0, end)
+            if end not in distances:
+                self.assertIsNone(path)
+                continue
+            self.assertEqual(len(path) - 1, distances[end])
+            self.assertEqual((path[0], path[-1]), (0, end))
+            for v1, v2 in zip(path, path[1:]):
+                self.assertIn(v2, self.graph[v1])
+
+
 if __name__ == '__main__':
     unittest.main()